@@ -18,11 +18,11 @@ from azure_db import query_data, get_connection_mode
 # Full database for competitor analysis (8.8M rows)
 from blob_storage import load_full_data
 from discipline_knowledge import (
-    DISCIPLINE_KNOWLEDGE, TOKYO_2025_STANDARDS, LA_2028_STANDARDS,
+    TOKYO_2025_STANDARDS, LA_2028_STANDARDS,
     EVENT_QUOTAS as DISCIPLINE_QUOTAS, get_event_standard, get_event_quota, get_event_knowledge
 )
 # Coach View module for simplified coaching interface
-from coach_view import render_coach_view
+from coach_view import render_coach_view, frame_content_key
 # Performance caching utilities
 from performance_cache import optimize_dataframe, get_cache_stats, timed
 # Projection engine for form projections and advancement probability
@@ -1121,6 +1121,9 @@ def load_data(_cache_version="v8"):  # Change version to force cache refresh
     # Clean athlete data (deduplicate IDs, normalize names)
     if not df.empty:
         df = clean_athlete_data(df)
+        # Content key hashed once per load (survives the cache round-trip);
+        # Coach View keys its cached helpers on it
+        df.attrs['data_key'] = frame_content_key(df)
 
     return df
 
@@ -6733,7 +6736,7 @@ def main():
 
     # Render based on view mode
     if view_mode == "Coach View":
-        render_coach_view(df_all)
+        render_coach_view(df_all, df_all.attrs.get('data_key'))
         return  # Exit after Coach View
 
     # Analyst View - Tab navigation (compact labels to fit all on screen)
@@ -8,14 +8,41 @@ Reusable Altair chart components for:
 - Competitor comparison bars
 - Performance distribution histograms
 
-All charts styled for dark theme and export-ready.
+All charts styled for dark theme and export-ready. The season progression,
+gap analysis and probability charts are built once as raw Vega-Lite dicts
+(`*_spec`, for st.vega_lite_chart); their Altair builders wrap those specs.
 """
 
+import base64
+import json
+
 import altair as alt
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
+# Optional fast JSON serialization for chart specs
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional LZ-String compression for standalone chart HTML
+try:
+    from lzstring import LZString
+    LZSTRING_AVAILABLE = True
+except ImportError:
+    LZSTRING_AVAILABLE = False
+
+# Optional in-process PNG rendering (no browser/driver needed)
+try:
+    import vl_convert as vlc
+    VL_CONVERT_AVAILABLE = True
+except ImportError:
+    VL_CONVERT_AVAILABLE = False
+
 
 # Chart color palette (dark theme compatible)
 COLORS = {
@@ -56,17 +83,118 @@ def get_base_config():
     }
 
 
+def _recent_cutoff() -> pd.Timestamp:
+    """Start of the two-year window shown on season progression charts."""
+    return pd.Timestamp.now() - pd.Timedelta(days=730)
+
+
+# Benchmark rows in display order (best to weakest line)
+_BENCH_ORDER = ('medal', 'final', 'semi', 'heat')
+_BENCH_LABELS = {
+    'medal': 'Medal Line',
+    'final': 'Final Line',
+    'semi': 'Semi Line',
+    'heat': 'Heat Line'
+}
+_BENCH_COLORS = {
+    'medal': COLORS['medal_gold'],
+    'final': COLORS['final_line'],
+    'semi': COLORS['semi_line'],
+    'heat': COLORS['heat_line']
+}
+
+
+def _benchmark_rows(benchmarks: Dict[str, float]) -> List[Dict]:
+    """Benchmark line rows ({'benchmark', 'value', 'color'}) for the overlays."""
+    return [
+        {'benchmark': _BENCH_LABELS[key], 'value': value, 'color': _BENCH_COLORS[key]}
+        for key, value in benchmarks.items()
+        if value is not None and key in _BENCH_COLORS
+    ]
+
+
+def _progression_data(
+    performances: List[Dict],
+    benchmarks: Optional[Dict[str, float]],
+    event_type: str,
+    cutoff: Optional[pd.Timestamp]
+) -> Optional[Tuple[Dict[str, list], int, List[float]]]:
+    """
+    Chart data for season_progression_spec.
+
+    Returns:
+        (columns, n_recent, y_domain) - column-oriented values of the
+        recent window (or the last 20 results when nothing is recent), the
+        number of points, and the y-axis domain (reversed for time events);
+        None when no performance has a date
+    """
+    # Column-oriented data: one array per field rather than one object per
+    # meet, so key names aren't repeated in the embedded spec. Vega-Lite
+    # flattens the arrays back into rows client-side.
+    dates = pd.to_datetime([p['date'] for p in performances]).to_numpy(dtype='datetime64[ns]')
+    results = np.asarray([p['result'] for p in performances], dtype=np.float64)
+    competitions = np.asarray([p.get('competition') for p in performances], dtype=object)
+
+    # Undated results can't be placed on the time axis (argsort would also
+    # put NaT last, inside the recent window)
+    dated = ~np.isnat(dates)
+    if not dated.any():
+        return None
+    dates, results, competitions = dates[dated], results[dated], competitions[dated]
+
+    # Sort once on the datetime64 values (chronological order)
+    order = np.argsort(dates, kind='stable')
+    dates, results, competitions = dates[order], results[order], competitions[order]
+
+    # Filter to recent performances only (last 2 years) for cleaner display.
+    # Dates are sorted, so the recent window is a binary search and a slice;
+    # only the points actually drawn go into the spec.
+    two_years_ago = cutoff if cutoff is not None else _recent_cutoff()
+    start = int(np.searchsorted(dates, two_years_ago.to_datetime64()))
+    if start < len(dates):
+        dates, results, competitions = dates[start:], results[start:], competitions[start:]
+    else:
+        # Fallback to last 20 if no recent data
+        dates, results, competitions = dates[-20:], results[-20:], competitions[-20:]
+
+    columns = {
+        'date': np.datetime_as_string(dates, unit='s').tolist(),
+        'result': results.tolist(),
+        'competition': competitions.tolist()
+    }
+
+    # Calculate y-axis domain based on data + benchmarks
+    all_values = results
+    if benchmarks:
+        bench_values = [v for v in benchmarks.values() if v is not None]
+        if bench_values:
+            all_values = np.concatenate([all_values, np.asarray(bench_values, dtype=np.float64)])
+
+    lo, hi = float(all_values.min()), float(all_values.max())
+    y_min = lo * 0.98 if event_type != 'time' else lo - 0.5
+    y_max = hi * 1.02 if event_type != 'time' else hi + 0.5
+
+    # For time events: lower is better, so reverse axis
+    # y_min should be the BEST (lowest) time, y_max the WORST (highest)
+    y_domain = [y_max, y_min] if event_type == 'time' else [y_min, y_max]
+
+    return columns, len(results), y_domain
+
+
 def season_progression_chart(
     performances: List[Dict],
     benchmarks: Dict[str, float] = None,
     event_type: str = 'time',
     title: str = 'Season Progression',
     width: int = 600,
-    height: int = 300
+    height: int = 300,
+    _cutoff: Optional[pd.Timestamp] = None
 ) -> alt.Chart:
     """
     Create season progression line chart with benchmark overlays.
 
+    Altair wrapper around season_progression_spec.
+
     Args:
         performances: List of dicts with 'date', 'result', 'competition' keys
         benchmarks: Dict with 'medal', 'final', 'semi', 'heat' lines
@@ -74,134 +202,127 @@ def season_progression_chart(
         title: Chart title
         width: Chart width in pixels
         height: Chart height in pixels
+        _cutoff: Start of the recent window; computed on demand if None
+            (create_report_charts passes one shared value per run)
 
     Returns:
         Altair chart object
     """
-    if not performances:
-        return alt.Chart().mark_text().encode(
-            text=alt.value('No performance data available')
-        ).properties(width=width, height=height)
+    return _chart_from_spec(season_progression_spec(
+        performances, benchmarks, event_type, title, width, height, _cutoff
+    ))
 
-    # Create DataFrame
-    df = pd.DataFrame(performances)
-    df['date'] = pd.to_datetime(df['date'])
-    df = df.sort_values('date')  # Ensure chronological order
 
-    # Filter to recent performances only (last 2 years) for cleaner display
-    two_years_ago = pd.Timestamp.now() - pd.Timedelta(days=730)
-    df_recent = df[df['date'] >= two_years_ago]
-    if df_recent.empty:
-        df_recent = df.tail(20)  # Fallback to last 20 if no recent data
+def _message_spec(message: str, width: int, height: int) -> Dict:
+    """Raw Vega-Lite spec for a text-only placeholder chart."""
+    return {
+        '$schema': alt.SCHEMA_URL,
+        'width': width,
+        'height': height,
+        'mark': 'text',
+        'encoding': {'text': {'value': message}}
+    }
 
-    # Calculate y-axis domain based on data + benchmarks
-    all_values = df_recent['result'].tolist()
-    if benchmarks:
-        all_values.extend([v for v in benchmarks.values() if v is not None])
 
-    y_min = min(all_values) * 0.98 if event_type != 'time' else min(all_values) - 0.5
-    y_max = max(all_values) * 1.02 if event_type != 'time' else max(all_values) + 0.5
+def _chart_from_spec(spec: Dict) -> alt.Chart:
+    """Altair chart object for a raw Vega-Lite spec built by a *_spec helper."""
+    chart_cls = alt.LayerChart if 'layer' in spec else alt.Chart
+    return chart_cls.from_dict(spec, validate=False)
 
-    # For time events: lower is better, so reverse axis
-    # y_min should be the BEST (lowest) time, y_max the WORST (highest)
-    y_scale = alt.Scale(
-        domain=[y_max, y_min] if event_type == 'time' else [y_min, y_max],
-        nice=True
-    )
-
-    # Calculate date range for appropriate axis formatting
-    date_range = (df_recent['date'].max() - df_recent['date'].min()).days
-
-    # Base performance line with cleaner date axis
-    base = alt.Chart(df_recent).encode(
-        x=alt.X('date:T',
-                title='Date',
-                axis=alt.Axis(
-                    format='%b %y',  # Shorter format: "Jan 24"
-                    labelAngle=-45,
-                    tickCount=min(len(df_recent), 6)  # Fewer tick marks
-                )),
-        tooltip=[
-            alt.Tooltip('date:T', title='Date', format='%d %b %Y'),
-            alt.Tooltip('result:Q', title='Result', format='.2f'),
-            alt.Tooltip('competition:N', title='Competition')
-        ]
-    )
-
-    # Performance points and line - use shared y_scale
-    points = base.mark_circle(size=80, color=COLORS['primary']).encode(
-        y=alt.Y('result:Q', title='Performance', scale=y_scale)
-    )
 
-    line = base.mark_line(color=COLORS['primary'], strokeWidth=2).encode(
-        y=alt.Y('result:Q', scale=y_scale)
-    )
+def season_progression_spec(
+    performances: List[Dict],
+    benchmarks: Dict[str, float] = None,
+    event_type: str = 'time',
+    title: str = 'Season Progression',
+    width: int = 600,
+    height: int = 300,
+    _cutoff: Optional[pd.Timestamp] = None
+) -> Dict:
+    """
+    Season progression line chart with benchmark overlays, as a raw
+    Vega-Lite spec.
 
-    chart = line + points
+    Built as plain dicts for st.vega_lite_chart, skipping Altair's object
+    construction and schema validation on every rerun;
+    season_progression_chart wraps it for Altair callers. Args as for
+    season_progression_chart.
 
-    # Add benchmark lines if provided
-    if benchmarks:
-        benchmark_data = []
-        benchmark_colors = {
-            'medal': COLORS['medal_gold'],
-            'final': COLORS['final_line'],
-            'semi': COLORS['semi_line'],
-            'heat': COLORS['heat_line']
-        }
-        benchmark_labels = {
-            'medal': 'Medal Line',
-            'final': 'Final Line',
-            'semi': 'Semi Line',
-            'heat': 'Heat Line'
-        }
+    Returns:
+        Vega-Lite spec dict
+    """
+    data = _progression_data(performances, benchmarks, event_type, _cutoff) if performances else None
+    if data is None:
+        return _message_spec('No performance data available', width, height)
+
+    columns, n_recent, y_domain = data
+    y_scale = {'domain': y_domain, 'nice': True}
+
+    # Flattened fields are not auto-parsed, so turn the ISO strings back into
+    # (local) dates before encoding
+    transform = [
+        {'flatten': list(columns)},
+        {'calculate': 'toDate(datum.date)', 'as': 'date'}
+    ]
+
+    # Line and points share data, transforms and encodings
+    performance_layer = {
+        'data': {'values': [columns]},
+        'transform': transform,
+        'encoding': {
+            'x': {
+                'field': 'date', 'type': 'temporal', 'title': 'Date',
+                'axis': {'format': '%b %y', 'labelAngle': -45, 'tickCount': min(n_recent, 6)}
+            },
+            'y': {'field': 'result', 'type': 'quantitative', 'title': 'Performance', 'scale': y_scale},
+            'tooltip': [
+                {'field': 'date', 'type': 'temporal', 'title': 'Date', 'format': '%d %b %Y'},
+                {'field': 'result', 'type': 'quantitative', 'title': 'Result', 'format': '.2f'},
+                {'field': 'competition', 'type': 'nominal', 'title': 'Competition'}
+            ]
+        },
+        'layer': [
+            {'mark': {'type': 'line', 'color': COLORS['primary'], 'strokeWidth': 2}},
+            {'mark': {'type': 'circle', 'size': 80, 'color': COLORS['primary']}}
+        ]
+    }
+    layers = [performance_layer]
+
+    benchmark_data = _benchmark_rows(benchmarks) if benchmarks else []
+    if benchmark_data:
+        color_scale = {'domain': list(_BENCH_LABELS.values()), 'range': list(_BENCH_COLORS.values())}
+        layers.append({
+            'data': {'values': benchmark_data},
+            'encoding': {
+                'y': {'field': 'value', 'type': 'quantitative', 'scale': y_scale},
+                'color': {'field': 'benchmark', 'type': 'nominal', 'scale': color_scale}
+            },
+            'layer': [
+                {
+                    'mark': {'type': 'rule', 'strokeDash': [5, 5], 'strokeWidth': 2},
+                    'encoding': {'color': {
+                        'field': 'benchmark', 'type': 'nominal', 'scale': color_scale,
+                        'legend': {'title': 'Benchmarks'}
+                    }}
+                },
+                {
+                    'mark': {'type': 'text', 'align': 'right', 'dx': -5, 'dy': -5, 'fontSize': 10},
+                    'encoding': {
+                        'text': {'field': 'benchmark', 'type': 'nominal'},
+                        'color': {'field': 'benchmark', 'type': 'nominal', 'scale': color_scale, 'legend': None}
+                    }
+                }
+            ]
+        })
 
-        for key, value in benchmarks.items():
-            if value is not None and key in benchmark_colors:
-                benchmark_data.append({
-                    'benchmark': benchmark_labels.get(key, key),
-                    'value': value,
-                    'color': benchmark_colors[key]
-                })
-
-        if benchmark_data:
-            bench_df = pd.DataFrame(benchmark_data)
-
-            # Use same y_scale for benchmark rules
-            rules = alt.Chart(bench_df).mark_rule(strokeDash=[5, 5]).encode(
-                y=alt.Y('value:Q', scale=y_scale),
-                color=alt.Color('benchmark:N',
-                               scale=alt.Scale(
-                                   domain=list(benchmark_labels.values()),
-                                   range=list(benchmark_colors.values())
-                               ),
-                               legend=alt.Legend(title='Benchmarks')),
-                strokeWidth=alt.value(2)
-            )
-
-            # Add labels for benchmark lines - use same y_scale
-            labels = alt.Chart(bench_df).mark_text(
-                align='right',
-                dx=-5,
-                dy=-5,
-                fontSize=10
-            ).encode(
-                y=alt.Y('value:Q', scale=y_scale),
-                text='benchmark:N',
-                color=alt.Color('benchmark:N',
-                               scale=alt.Scale(
-                                   domain=list(benchmark_labels.values()),
-                                   range=list(benchmark_colors.values())
-                               ),
-                               legend=None)
-            )
-
-            chart = chart + rules + labels
-
-    return chart.properties(
-        width=width,
-        height=height,
-        title=title
-    ).configure(**get_base_config())
+    return {
+        '$schema': alt.SCHEMA_URL,
+        'title': title,
+        'width': width,
+        'height': height,
+        'config': get_base_config(),
+        'layer': layers
+    }
 
 
 def gap_analysis_chart(
@@ -215,6 +336,8 @@ def gap_analysis_chart(
     """
     Create horizontal bar chart showing gap to each benchmark.
 
+    Altair wrapper around gap_analysis_spec.
+
     Args:
         athlete_performance: Athlete's season best or projected performance
         benchmarks: Dict with benchmark values
@@ -226,79 +349,114 @@ def gap_analysis_chart(
     Returns:
         Altair chart object
     """
-    data = []
+    return _chart_from_spec(gap_analysis_spec(
+        athlete_performance, benchmarks, event_type, title, width, height
+    ))
 
-    benchmark_order = ['medal', 'final', 'semi', 'heat']
-    benchmark_labels = {
-        'medal': 'Medal Line',
-        'final': 'Final Line',
-        'semi': 'Semi Line',
-        'heat': 'Heat Line'
-    }
 
-    for key in benchmark_order:
-        if key in benchmarks and benchmarks[key] is not None:
-            target = benchmarks[key]
-            if event_type == 'time':
-                gap = athlete_performance - target  # Positive = behind
-            else:
-                gap = target - athlete_performance  # Positive = behind
-
-            data.append({
-                'benchmark': benchmark_labels.get(key, key),
-                'target': target,
-                'gap': gap,
-                'status': 'Ahead' if gap < 0 else 'Behind',
-                'order': benchmark_order.index(key)
-            })
+def gap_analysis_spec(
+    athlete_performance: float,
+    benchmarks: Dict[str, float],
+    event_type: str = 'time',
+    title: str = 'Gap Analysis',
+    width: int = 500,
+    height: int = 200
+) -> Dict:
+    """
+    Gap-to-benchmark bar chart as a raw Vega-Lite spec (see
+    season_progression_spec). Args as for gap_analysis_chart.
 
-    if not data:
-        return alt.Chart().mark_text().encode(
-            text=alt.value('No benchmark data available')
-        ).properties(width=width, height=height)
+    Returns:
+        Vega-Lite spec dict
+    """
+    keys = [k for k in _BENCH_ORDER if benchmarks.get(k) is not None]
 
-    df = pd.DataFrame(data)
+    if not keys:
+        return _message_spec('No benchmark data available', width, height)
 
-    # Create bar chart
-    bars = alt.Chart(df).mark_bar().encode(
-        y=alt.Y('benchmark:N',
-                title=None,
-                sort=alt.EncodingSortField(field='order', order='ascending')),
-        x=alt.X('gap:Q',
-                title='Gap (negative = ahead, positive = behind)',
-                scale=alt.Scale(domain=[-max(abs(df['gap'].min()), abs(df['gap'].max())) * 1.2,
-                                        max(abs(df['gap'].min()), abs(df['gap'].max())) * 1.2])),
-        color=alt.condition(
-            alt.datum.gap < 0,
-            alt.value(COLORS['success']),
-            alt.value(COLORS['danger'])
-        ),
-        tooltip=['benchmark:N', 'target:Q', 'gap:Q', 'status:N']
-    )
+    targets = np.fromiter((benchmarks[k] for k in keys), dtype=np.float64, count=len(keys))
+    gaps = athlete_performance - targets if event_type == 'time' else targets - athlete_performance
+    max_gap = float(np.abs(gaps).max()) * 1.2
 
-    # Add zero line
-    zero_line = alt.Chart(pd.DataFrame({'x': [0]})).mark_rule(
-        color=COLORS['text'],
-        strokeWidth=2
-    ).encode(x='x:Q')
+    rows = [
+        {'benchmark': _BENCH_LABELS[k], 'target': target, 'gap': gap,
+         'status': 'Ahead' if gap < 0 else 'Behind', 'order': i}
+        for i, (k, target, gap) in enumerate(zip(keys, targets.tolist(), gaps.tolist()))
+    ]
+    y = {'field': 'benchmark', 'type': 'nominal', 'sort': {'field': 'order', 'order': 'ascending'}}
 
-    # Add gap labels
-    labels = alt.Chart(df).mark_text(
-        align='left',
-        dx=5,
-        fontSize=12,
-        color=COLORS['text']
-    ).encode(
-        y=alt.Y('benchmark:N', sort=alt.EncodingSortField(field='order', order='ascending')),
-        x=alt.X('gap:Q'),
-        text=alt.Text('gap:Q', format='+.2f')
-    )
+    return {
+        '$schema': alt.SCHEMA_URL,
+        'title': title,
+        'width': width,
+        'height': height,
+        'config': get_base_config(),
+        'layer': [
+            {
+                'data': {'values': rows},
+                'mark': 'bar',
+                'encoding': {
+                    'y': dict(y, title=None),
+                    'x': {
+                        'field': 'gap', 'type': 'quantitative',
+                        'title': 'Gap (negative = ahead, positive = behind)',
+                        'scale': {'domain': [-max_gap, max_gap]}
+                    },
+                    'color': {
+                        'condition': {'test': 'datum.gap < 0', 'value': COLORS['success']},
+                        'value': COLORS['danger']
+                    },
+                    'tooltip': [
+                        {'field': 'benchmark', 'type': 'nominal'},
+                        {'field': 'target', 'type': 'quantitative'},
+                        {'field': 'gap', 'type': 'quantitative'},
+                        {'field': 'status', 'type': 'nominal'}
+                    ]
+                }
+            },
+            {
+                'data': {'values': [{'x': 0}]},
+                'mark': {'type': 'rule', 'color': COLORS['text'], 'strokeWidth': 2},
+                'encoding': {'x': {'field': 'x', 'type': 'quantitative'}}
+            },
+            {
+                'data': {'values': rows},
+                'mark': {'type': 'text', 'align': 'left', 'dx': 5, 'fontSize': 12, 'color': COLORS['text']},
+                'encoding': {
+                    'y': y,
+                    'x': {'field': 'gap', 'type': 'quantitative'},
+                    'text': {'field': 'gap', 'type': 'quantitative', 'format': '+.2f'}
+                }
+            }
+        ]
+    }
 
-    return (bars + zero_line + labels).properties(
-        width=width,
-        height=height,
-        title=title
-    ).configure(**get_base_config())
+
+# Advancement rounds in display order, with their gauge labels
+_ROUND_ORDER = ('heat', 'semi', 'final', 'medal')
+_ROUND_LABELS = {
+    'heat': 'Make Heats',
+    'semi': 'Make Semis',
+    'final': 'Make Finals',
+    'medal': 'Win Medal'
+}
+
+# Vega expression bucketing a probability into the gauge colors
+_PROB_COLOR_EXPR = "datum.probability >= 70 ? 'high' : (datum.probability >= 40 ? 'medium' : 'low')"
+
+
+def _probability_rows(probabilities: Dict[str, float]) -> List[Dict]:
+    """Gauge rows ({'round', 'probability', 'order', 'prob_text'}) in round order."""
+    return [
+        {
+            'round': _ROUND_LABELS[key],
+            'probability': probabilities[key],
+            'order': i,
+            'prob_text': f"{probabilities[key]:.0f}%"
+        }
+        for i, key in enumerate(_ROUND_ORDER)
+        if key in probabilities
+    ]
 
 
 def probability_gauge(
@@ -310,6 +468,8 @@ def probability_gauge(
     """
     Create probability gauge bars for each round.
 
+    Altair wrapper around probability_gauge_spec.
+
     Args:
         probabilities: Dict with round names and probability percentages
         title: Chart title
@@ -319,75 +479,83 @@ def probability_gauge(
     Returns:
         Altair chart object
     """
-    data = []
-    round_order = ['heat', 'semi', 'final', 'medal']
-    round_labels = {
-        'heat': 'Make Heats',
-        'semi': 'Make Semis',
-        'final': 'Make Finals',
-        'medal': 'Win Medal'
-    }
+    return _chart_from_spec(probability_gauge_spec(probabilities, title, width, height))
 
-    for i, key in enumerate(round_order):
-        if key in probabilities:
-            prob = probabilities[key]
-            data.append({
-                'round': round_labels.get(key, key),
-                'probability': prob,
-                'order': i,
-                'prob_text': f"{prob:.0f}%"
-            })
 
-    if not data:
-        return alt.Chart().mark_text().encode(
-            text=alt.value('No probability data')
-        ).properties(width=width, height=height)
+def probability_gauge_spec(
+    probabilities: Dict[str, float],
+    title: str = 'Advancement Probability',
+    width: int = 400,
+    height: int = 150
+) -> Dict:
+    """
+    Advancement probability gauge as a raw Vega-Lite spec (see
+    season_progression_spec). Args as for probability_gauge.
 
-    df = pd.DataFrame(data)
+    Returns:
+        Vega-Lite spec dict
+    """
+    data = _probability_rows(probabilities)
 
-    # Background bars (100%)
-    background = alt.Chart(df).mark_bar(color=COLORS['grid']).encode(
-        y=alt.Y('round:N',
-                title=None,
-                sort=alt.EncodingSortField(field='order', order='descending')),
-        x=alt.X('max_val:Q',
-                title='Probability %',
-                scale=alt.Scale(domain=[0, 100]))
-    ).transform_calculate(max_val='100')
-
-    # Probability bars - use transform_calculate for color classification
-    bars = alt.Chart(df).transform_calculate(
-        color_category="datum.probability >= 70 ? 'high' : (datum.probability >= 40 ? 'medium' : 'low')"
-    ).mark_bar().encode(
-        y=alt.Y('round:N', sort=alt.EncodingSortField(field='order', order='descending')),
-        x=alt.X('probability:Q'),
-        color=alt.Color('color_category:N',
-                       scale=alt.Scale(
-                           domain=['high', 'medium', 'low'],
-                           range=[COLORS['success'], COLORS['warning'], COLORS['danger']]
-                       ),
-                       legend=None),
-        tooltip=['round:N', 'probability:Q']
-    )
+    if not data:
+        return _message_spec('No probability data', width, height)
 
-    # Probability labels
-    labels = alt.Chart(df).mark_text(
-        align='left',
-        dx=5,
-        fontSize=12,
-        fontWeight='bold',
-        color=COLORS['text']
-    ).encode(
-        y=alt.Y('round:N', sort=alt.EncodingSortField(field='order', order='descending')),
-        x=alt.X('probability:Q'),
-        text='prob_text:N'
-    )
+    y = {'field': 'round', 'type': 'nominal', 'sort': {'field': 'order', 'order': 'descending'}}
 
-    return (background + bars + labels).properties(
-        width=width,
-        height=height,
-        title=title
-    ).configure(**get_base_config())
+    return {
+        '$schema': alt.SCHEMA_URL,
+        'title': title,
+        'width': width,
+        'height': height,
+        'config': get_base_config(),
+        'data': {'values': data},
+        'layer': [
+            # Background bars (100%)
+            {
+                'transform': [{'calculate': '100', 'as': 'max_val'}],
+                'mark': {'type': 'bar', 'color': COLORS['grid']},
+                'encoding': {
+                    'y': dict(y, title=None),
+                    'x': {
+                        'field': 'max_val', 'type': 'quantitative',
+                        'title': 'Probability %', 'scale': {'domain': [0, 100]}
+                    }
+                }
+            },
+            # Probability bars
+            {
+                'transform': [{'calculate': _PROB_COLOR_EXPR, 'as': 'color_category'}],
+                'mark': 'bar',
+                'encoding': {
+                    'y': y,
+                    'x': {'field': 'probability', 'type': 'quantitative'},
+                    'color': {
+                        'field': 'color_category', 'type': 'nominal', 'legend': None,
+                        'scale': {
+                            'domain': ['high', 'medium', 'low'],
+                            'range': [COLORS['success'], COLORS['warning'], COLORS['danger']]
+                        }
+                    },
+                    'tooltip': [
+                        {'field': 'round', 'type': 'nominal'},
+                        {'field': 'probability', 'type': 'quantitative'}
+                    ]
+                }
+            },
+            # Probability labels
+            {
+                'mark': {
+                    'type': 'text', 'align': 'left', 'dx': 5, 'fontSize': 12,
+                    'fontWeight': 'bold', 'color': COLORS['text']
+                },
+                'encoding': {
+                    'y': y,
+                    'x': {'field': 'probability', 'type': 'quantitative'},
+                    'text': {'field': 'prob_text', 'type': 'nominal'}
+                }
+            }
+        ]
+    }
 
 
 def competitor_comparison_chart(
@@ -465,7 +633,7 @@ def competitor_comparison_chart(
         text=alt.Text('sb:Q', format='.2f')
     )
 
-    return (bars + labels).properties(
+    return alt.layer(bars, labels).properties(
         width=width,
         height=height,
         title=title
@@ -497,11 +665,13 @@ def form_trend_chart(
             text=alt.value('No data')
         ).properties(width=width, height=height)
 
-    df = pd.DataFrame(performances)
-    df['index'] = range(len(df))
+    # Inline values with a precomputed index - no DataFrame for a sparkline
+    source = alt.Data(values=[
+        {'index': i, 'result': p['result']} for i, p in enumerate(performances)
+    ])
 
     # Line chart
-    line = alt.Chart(df).mark_line(
+    line = alt.Chart(source).mark_line(
         color=COLORS['primary'],
         strokeWidth=3
     ).encode(
@@ -512,7 +682,7 @@ def form_trend_chart(
     )
 
     # Points
-    points = alt.Chart(df).mark_circle(
+    points = alt.Chart(source).mark_circle(
         size=100,
         color=COLORS['primary']
     ).encode(
@@ -522,7 +692,7 @@ def form_trend_chart(
     )
 
     # Trend line (linear regression)
-    trend = alt.Chart(df).transform_regression(
+    trend = alt.Chart(source).transform_regression(
         'index', 'result'
     ).mark_line(
         color=COLORS['warning'],
@@ -533,7 +703,7 @@ def form_trend_chart(
         y='result:Q'
     )
 
-    return (line + points + trend).properties(
+    return alt.layer(line, points, trend).properties(
         width=width,
         height=height,
         title=title
@@ -546,7 +716,8 @@ def create_report_charts(
     benchmarks: Dict[str, float],
     competitors: List[Dict],
     probabilities: Dict[str, float],
-    event_type: str = 'time'
+    event_type: str = 'time',
+    _cutoff: Optional[pd.Timestamp] = None
 ) -> Dict[str, alt.Chart]:
     """
     Create all charts needed for an athlete report card.
@@ -558,10 +729,14 @@ def create_report_charts(
         competitors: List of competitor dicts
         probabilities: Dict with round probabilities
         event_type: 'time', 'distance', or 'points'
+        _cutoff: Recent-window cutoff shared across reports; defaults to now
 
     Returns:
         Dict of chart name -> Altair chart object
     """
+    # One recent-window cutoff shared by every chart in the run
+    cutoff = _cutoff if _cutoff is not None else _recent_cutoff()
+
     charts = {}
 
     # Season progression
@@ -569,7 +744,8 @@ def create_report_charts(
         performances=performances,
         benchmarks=benchmarks,
         event_type=event_type,
-        title=f"Season Progression - {athlete_data.get('name', 'Athlete')}"
+        title=f"Season Progression - {athlete_data.get('name', 'Athlete')}",
+        _cutoff=cutoff
     )
 
     # Gap analysis
@@ -608,27 +784,77 @@ def create_report_charts(
     return charts
 
 
+# Standalone chart page; {loader} is a JS expression that yields the spec
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <script src="https://cdn.jsdelivr.net/npm/vega@{vega}"></script>
+  <script src="https://cdn.jsdelivr.net/npm/vega-lite@{vegalite}"></script>
+  <script src="https://cdn.jsdelivr.net/npm/vega-embed@{vegaembed}"></script>{extra_scripts}
+</head>
+<body>
+  <div id="vis"></div>
+  <script type="text/javascript">
+    var SPEC = {spec};
+    vegaEmbed('#vis', {loader});
+  </script>
+</body>
+</html>
+"""
+
+_LZ_SCRIPT = '\n  <script src="https://cdn.jsdelivr.net/npm/lz-string@1.5.0/libs/lz-string.min.js"></script>'
+_LZ_LOADER = 'JSON.parse(LZString.decompressFromEncodedURIComponent(SPEC))'
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes, via orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=str, separators=(',', ':')).encode('utf-8')
+
+
 def chart_to_html(chart: alt.Chart) -> str:
-    """Convert Altair chart to HTML string for embedding in reports."""
-    return chart.to_html()
+    """
+    Convert Altair chart to HTML string for embedding in reports.
+
+    The spec is serialized once (orjson when available) and embedded
+    LZ-String compressed (if lzstring is installed, decompressed client-side
+    before vegaEmbed) or as a plain JSON literal. Keeps batch-written report
+    files small and skips Altair's own HTML/JSON encoder.
+    """
+    spec_json = _dumps(chart.to_dict()).decode('utf-8')
+
+    if LZSTRING_AVAILABLE:
+        spec = '"' + LZString().compressToEncodedURIComponent(spec_json) + '"'
+        extra_scripts, loader = _LZ_SCRIPT, _LZ_LOADER
+    else:
+        # Escape '</' so text in the spec can't close the <script> element
+        spec = spec_json.replace('</', '<\\/')
+        extra_scripts, loader = '', 'SPEC'
+
+    return _HTML_TEMPLATE.format(
+        vega=alt.VEGA_VERSION,
+        vegalite=alt.VEGALITE_VERSION,
+        vegaembed=alt.VEGAEMBED_VERSION,
+        extra_scripts=extra_scripts,
+        spec=spec,
+        loader=loader
+    )
 
 
-def chart_to_png_base64(chart: alt.Chart) -> str:
+def chart_to_png_base64(chart: alt.Chart, scale: float = 2) -> str:
     """
     Convert Altair chart to base64 PNG for embedding in PDFs.
 
-    Note: Requires altair_saver and selenium/chromedriver.
-    Falls back to SVG if PNG generation fails.
+    Note: Requires vl-convert-python (pip install vl-convert-python), which
+    renders in-process instead of driving a headless browser.
+    Returns an empty string if it is not installed or rendering fails.
     """
+    if not VL_CONVERT_AVAILABLE:
+        return ''
     try:
-        import io
-        import base64
-        png_data = chart.save(fp=None, format='png')
-        return base64.b64encode(png_data).decode('utf-8')
+        png_data = vlc.vegalite_to_png(chart.to_dict(), scale=scale)
+        return base64.b64encode(png_data).decode('ascii')
     except Exception:
-        # Fall back to SVG
-        try:
-            svg_data = chart.save(fp=None, format='svg')
-            return base64.b64encode(svg_data.encode('utf-8')).decode('utf-8')
-        except Exception:
-            return ''
+        return ''
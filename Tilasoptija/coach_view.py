@@ -10,12 +10,19 @@ Provides simplified, action-focused interface for coaches including:
 This module integrates with the main dashboard via view mode toggle.
 """
 
+import hashlib
+import importlib
+import importlib.util
+import io
+import weakref
+import zipfile
 import streamlit as st
+import numpy as np
 import pandas as pd
-import altair as alt
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-import statistics
+from typing import Dict, List, Optional, Tuple
+from collections import namedtuple
+from functools import lru_cache
 
 # Import our custom modules
 from projection_engine import (
@@ -25,26 +32,25 @@ from projection_engine import (
 )
 from historical_benchmarks import (
     get_default_benchmarks, format_benchmark_for_display,
-    get_event_type, BENCHMARK_METHODOLOGY
+    format_benchmarks_for_display, get_event_type, BENCHMARK_METHODOLOGY
 )
 from chart_components import (
-    season_progression_chart, gap_analysis_chart, probability_gauge,
-    competitor_comparison_chart, form_trend_chart, COLORS
-)
-from discipline_knowledge import (
-    TOKYO_2025_STANDARDS, LA_2028_STANDARDS, EVENT_QUOTAS,
-    get_event_standard, get_event_quota, DISCIPLINE_KNOWLEDGE
+    season_progression_spec, gap_analysis_spec, probability_gauge_spec
 )
+from discipline_knowledge import get_event_standard
+
+# Report generator (and reportlab behind it) is imported on first use by the
+# Export Center, not when the dashboard imports this module
+REPORT_GEN_AVAILABLE = importlib.util.find_spec('report_generator') is not None
 
-# Import report generator (with fallback if not available)
-try:
-    from report_generator import (
-        AthleteReportGenerator, CompetitionBriefingGenerator,
-        generate_html_report, check_dependencies
-    )
-    REPORT_GEN_AVAILABLE = True
-except ImportError:
-    REPORT_GEN_AVAILABLE = False
+
+@lru_cache(maxsize=1)
+def _load_report_generator():
+    """Import report_generator on first use; None if it cannot be imported."""
+    try:
+        return importlib.import_module('report_generator')
+    except ImportError:
+        return None
 
 # Import AI Analytics (with fallback if not available)
 try:
@@ -53,6 +59,10 @@ try:
 except ImportError:
     AI_ANALYTICS_AVAILABLE = False
 
+# Partial reruns (st.fragment, or st.experimental_fragment on older
+# Streamlit); without either, tabs simply rerun with the whole script
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
 # Upcoming championships with dates (Tokyo 2025 WC has completed)
 UPCOMING_CHAMPIONSHIPS = {
     "Asian Games 2026": {
@@ -76,155 +86,550 @@ UPCOMING_CHAMPIONSHIPS = {
 }
 
 
-def get_ksa_athletes(df: pd.DataFrame) -> pd.DataFrame:
-    """Get all KSA athletes from data (optimized - no copy unless necessary)."""
-    if 'Athlete_CountryCode' in df.columns:
-        return df[df['Athlete_CountryCode'] == 'KSA']
-    elif 'nationality' in df.columns:
-        return df[df['nationality'] == 'KSA']
+# Resolved column names - Tilastopaja names, or the lower-case raw DB names
+_ColumnMap = namedtuple('_ColumnMap', 'athlete event date result name gender comp country mark comp_id')
+
+
+@lru_cache(maxsize=32)
+def _resolve_columns_for(columns: tuple) -> _ColumnMap:
+    """Pick the column name variant present in `columns` for each field."""
+    def pick(primary: str, fallback: str) -> str:
+        return primary if primary in columns else fallback
+
+    return _ColumnMap(
+        athlete=pick('Athlete_ID', 'athleteid'),
+        event=pick('Event', 'eventname'),
+        date=pick('Start_Date', 'competitiondate'),
+        result=pick('Result_numeric', 'result_numeric'),
+        name=pick('Athlete_Name', 'firstname'),
+        gender=pick('Gender', 'gender'),
+        comp=pick('Competition', 'competitionname'),
+        country=pick('Athlete_CountryCode', 'nationality'),
+        mark=pick('Result', 'performance'),
+        comp_id=pick('Competition_ID', 'competitionid')
+    )
+
+
+def _resolve_columns(df: pd.DataFrame) -> _ColumnMap:
+    """Resolve column names once per column layout (memoized)."""
+    return _resolve_columns_for(tuple(df.columns))
+
+
+# Is_Hand_Timed values that mark a hand-timed result
+_HAND_TIMED_VALUES = frozenset([True, 1, '1', 'Y', 'Yes', 'y', 'yes', 'TRUE', 'True', 'true', 'H', 'h'])
+
+
+def frame_content_key(df: pd.DataFrame) -> str:
+    """
+    Content key of a DataFrame: shape, columns and a digest of every row.
+
+    Any in-place correction to any cell changes the key. Meant to be computed
+    once where the data is loaded (and cached), then passed to
+    render_coach_view as data_key.
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+    return f"{len(df)}_{hash(tuple(df.columns))}_{digest}"
+
+
+# id(frame) -> (weakref to the frame, key) for frames that already have a
+# cache key, so each frame object is only ever hashed once
+_FINGERPRINTS: Dict[int, Tuple[weakref.ref, str]] = {}
+
+
+def _remember_fingerprint(df: pd.DataFrame, key: str) -> pd.DataFrame:
+    """Record key as the cache key of this frame object; returns df."""
+    frame_id = id(df)
+    # Entry is dropped when the frame is garbage collected, before its id can be reused
+    ref = weakref.ref(df, lambda _, frame_id=frame_id: _FINGERPRINTS.pop(frame_id, None))
+    _FINGERPRINTS[frame_id] = (ref, key)
+    return df
+
+
+def _derived_frame(source: pd.DataFrame, result: pd.DataFrame, source_key: str, step: str) -> pd.DataFrame:
+    """Key a frame derived from source as source_key|step (no rehash); returns result."""
+    if result is not source:
+        _remember_fingerprint(result, f"{source_key}|{step}")
+    return result
+
+
+def _df_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Cache key of a DataFrame for the cached helpers below.
+
+    The frame itself is passed to cached functions as `_df` (not hashed by
+    Streamlit); this key stands in for it. Frames keyed by the loader or
+    derived by a cached helper reuse their recorded key; anything else gets
+    a full frame_content_key, computed once per frame object.
+    """
+    entry = _FINGERPRINTS.get(id(df))
+    if entry is not None and entry[0]() is df:
+        return entry[1]
+    key = frame_content_key(df)
+    _remember_fingerprint(df, key)
+    return key
+
+
+# Columns the Prep Hub and Report Cards actually read (both naming schemes)
+_COACH_VIEW_COLUMNS = [
+    'Athlete_ID', 'athleteid', 'Athlete_Name', 'firstname',
+    'Event', 'eventname', 'Gender', 'gender',
+    'Start_Date', 'competitiondate', 'Result', 'performance',
+    'Result_numeric', 'result_numeric', 'Competition', 'competitionname',
+    'Athlete_CountryCode', 'nationality', 'Is_Hand_Timed'
+]
+
+
+_COACH_VIEW_COLUMN_SET = frozenset(_COACH_VIEW_COLUMNS)
+
+
+# Low-cardinality columns that are filtered on repeatedly
+_COACH_VIEW_CATEGORICALS = ('Event', 'eventname', 'Gender', 'gender', 'Athlete_CountryCode', 'nationality')
+
+
+@st.cache_resource(ttl=600, max_entries=2, show_spinner=False)
+def _project_coach_view_cached(_df: pd.DataFrame, df_key: str) -> pd.DataFrame:
+    """
+    Cached projection of _df down to _COACH_VIEW_COLUMNS, with the
+    low-cardinality filter columns as categoricals (equality filters and
+    groupbys then work on integer codes).
+
+    Cached as a resource so the (large) projected frame is shared rather
+    than copied on every rerun; callers only read from it.
+
+    Args:
+        _df: DataFrame (underscore prefix tells Streamlit not to hash it)
+        df_key: Fingerprint of _df (from _df_fingerprint) used as the cache key
+    """
+    projected = _df[[c for c in _COACH_VIEW_COLUMNS if c in _df.columns]]
+    to_category = {
+        col: projected[col].astype('category')
+        for col in _COACH_VIEW_CATEGORICALS
+        if col in projected.columns and not isinstance(projected[col].dtype, pd.CategoricalDtype)
+    }
+    return projected.assign(**to_category) if to_category else projected
+
+
+def _is_coach_view_projection(df: pd.DataFrame) -> bool:
+    """True if df is already a Coach View projection (working columns only, filter columns categorical)."""
+    return (
+        _COACH_VIEW_COLUMN_SET.issuperset(df.columns)
+        and all(
+            isinstance(df[col].dtype, pd.CategoricalDtype)
+            for col in _COACH_VIEW_CATEGORICALS if col in df.columns
+        )
+    )
+
+
+def _project_coach_view(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink df to the Coach View working columns before any filtering."""
+    if _is_coach_view_projection(df):
+        return df
+    df_key = _df_fingerprint(df)
+    return _derived_frame(df, _project_coach_view_cached(df, df_key), df_key, 'coach_view')
+
+
+@st.cache_resource(ttl=600, max_entries=2, show_spinner=False)
+def _get_ksa_athletes_cached(_df: pd.DataFrame, df_key: str) -> pd.DataFrame:
+    """
+    Cached KSA subset of the data.
+
+    Cached as a resource (no pickle round-trip on each hit); callers only
+    read from it.
+
+    Args:
+        _df: DataFrame (underscore prefix tells Streamlit not to hash it)
+        df_key: Fingerprint of _df (from _df_fingerprint) used as the cache key
+    """
+    country_col = _resolve_columns(_df).country
+    if country_col in _df.columns:
+        return _df[_df[country_col] == 'KSA']
     return pd.DataFrame()
 
 
+def get_ksa_athletes(df: pd.DataFrame) -> pd.DataFrame:
+    """Get all KSA athletes from data (cached per DataFrame fingerprint)."""
+    df_key = _df_fingerprint(df)
+    return _derived_frame(df, _get_ksa_athletes_cached(df, df_key), df_key, 'ksa')
+
+
+@st.cache_resource(ttl=600, max_entries=8, show_spinner=False)
+def _ensure_datetime_columns_cached(_df: pd.DataFrame, df_key: str, date_col: str) -> pd.DataFrame:
+    """
+    Cached copy of _df with date_col parsed and a `_year` column added.
+
+    Shared as a resource like the KSA subset it is usually built from.
+
+    Args:
+        _df: DataFrame (underscore prefix tells Streamlit not to hash it)
+        df_key: Fingerprint of _df (from _df_fingerprint) used as the cache key
+    """
+    dates = _df[date_col]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors='coerce')
+    # int16 year for cheap season masks; 0 where the date is missing
+    return _df.assign(**{date_col: dates, '_year': dates.dt.year.fillna(0).astype(np.int16)})
+
+
+def _ensure_datetime_columns(df: pd.DataFrame, date_col: str) -> pd.DataFrame:
+    """
+    Parse date_col to datetime64 once per DataFrame (and precompute `_year`).
+
+    Returns df unchanged if that has already been done, so downstream
+    helpers can skip pd.to_datetime entirely.
+    """
+    if '_year' in df.columns and pd.api.types.is_datetime64_any_dtype(df[date_col]):
+        return df
+    if df.empty or date_col not in df.columns:
+        return df
+    df_key = _df_fingerprint(df)
+    return _derived_frame(df, _ensure_datetime_columns_cached(df, df_key, date_col), df_key, f'dates:{date_col}')
+
+
+@st.cache_resource(ttl=600, max_entries=8, show_spinner=False)
+def _filter_fat_times_cached(_df: pd.DataFrame, df_key: str) -> pd.DataFrame:
+    """
+    Cached FAT-only filter.
+
+    Cached as a resource (no pickle round-trip on each hit, and the input
+    frame itself comes back when nothing is filtered); callers only read
+    from it.
+
+    Args:
+        _df: DataFrame (underscore prefix tells Streamlit not to hash it)
+        df_key: Fingerprint of _df (from _df_fingerprint) used as the cache key
+    """
+    df = _df
+    keep = np.ones(len(df), dtype=bool)
+
+    # Filter out hand-timed results if the column exists
+    if 'Is_Hand_Timed' in df.columns:
+        keep &= ~df['Is_Hand_Timed'].isin(_HAND_TIMED_VALUES).to_numpy()
+
+    # Also filter by result format - hand times often end with 'h' suffix.
+    # Numeric results can't carry the suffix; otherwise only check the rows
+    # the hand-timed flag hasn't already dropped.
+    if 'Result' in df.columns and not pd.api.types.is_numeric_dtype(df['Result']):
+        remaining = np.flatnonzero(keep)
+        hand_suffix = df['Result'].iloc[remaining].astype(str).str.contains(
+            'h$', case=False, regex=True, na=False
+        ).to_numpy()
+        keep[remaining[hand_suffix]] = False
+
+    # Nothing hand-timed: hand back the frame itself rather than a copy
+    if keep.all():
+        return df
+    return df[keep]
+
+
 def filter_fat_times_only(df: pd.DataFrame) -> pd.DataFrame:
     """
     Filter dataframe to only include FAT (Fully Automatic Timing) results.
     Hand times are not valid for predictions as they're ~0.24s slower.
+
+    Cached per DataFrame fingerprint.
     """
     if df.empty:
         return df
+    # Neither timing signal present - nothing to filter on
+    if 'Is_Hand_Timed' not in df.columns and 'Result' not in df.columns:
+        return df
 
-    mask = pd.Series(True, index=df.index)
+    df_key = _df_fingerprint(df)
+    return _derived_frame(df, _filter_fat_times_cached(df, df_key), df_key, 'fat')
 
-    # Filter out hand-timed results if the column exists
-    if 'Is_Hand_Timed' in df.columns:
-        hand_timed_values = [True, 1, '1', 'Y', 'Yes', 'y', 'yes', 'TRUE', 'True', 'true', 'H', 'h']
-        mask = mask & (~df['Is_Hand_Timed'].isin(hand_timed_values))
 
-    # Also filter by result format - hand times often end with 'h' suffix
-    if 'Result' in df.columns:
-        mask = mask & (~df['Result'].astype(str).str.lower().str.endswith('h'))
+@st.cache_resource(ttl=300, max_entries=8, show_spinner=False)
+def _normalize_athlete_id_column(_df: pd.DataFrame, df_key: str, athlete_col: str) -> pd.Series:
+    """
+    Athlete IDs as a categorical of strings, converted once per DataFrame.
+
+    Only the distinct IDs are cast to str, and equality against it compares
+    integer codes rather than Python strings.
+
+    Args:
+        _df: DataFrame (underscore prefix tells Streamlit not to hash it)
+        df_key: Fingerprint of _df (from _df_fingerprint) used as the cache key
+    """
+    ids = _df[athlete_col]
+    if not isinstance(ids.dtype, pd.CategoricalDtype):
+        ids = ids.astype('category')
+    try:
+        return ids.cat.rename_categories(ids.cat.categories.astype(str))
+    except ValueError:
+        # Mixed types (e.g. 123 and '123') collapse to the same string
+        return _df[athlete_col].astype(str).astype('category')
+
+
+@st.cache_resource(ttl=300, max_entries=8, show_spinner=False)
+def _get_athlete_event_index(
+    _df: pd.DataFrame,
+    df_key: str,
+    athlete_col: str,
+    event_col: str
+) -> Dict[Tuple[str, str], np.ndarray]:
+    """
+    Row positions of every (athlete_id, event) pair, from a single groupby.
+
+    Cached as a resource (shared, not copied per call) since the index is
+    read-only and gets looked up once per athlete on every render.
 
-    return df[mask]
+    Args:
+        _df: DataFrame (underscore prefix tells Streamlit not to hash it)
+        df_key: Fingerprint of _df (from _df_fingerprint) used as the cache key
+    """
+    athlete_ids = _normalize_athlete_id_column(_df, df_key, athlete_col)
+    return _df.groupby([athlete_ids, _df[event_col]], sort=False, observed=True).indices
+
+
+def _athlete_event_rows(
+    df: pd.DataFrame,
+    athlete_col: str,
+    event_col: str,
+    athlete_id: str,
+    event: str,
+    df_key: Optional[str] = None
+) -> pd.DataFrame:
+    """Rows of df for one athlete/event via the cached index (no full-frame mask)."""
+    index = _get_athlete_event_index(df, df_key or _df_fingerprint(df), athlete_col, event_col)
+    positions = index.get((str(athlete_id), event))
+    return df.iloc[:0] if positions is None else df.take(positions)
 
 
 @st.cache_data(ttl=300, show_spinner=False)
 def _get_athlete_performances_cached(
-    _df_hash: str,
+    _df: pd.DataFrame,
+    df_key: str,
     athlete_id: str,
     event: str,
     limit: int,
-    athlete_col: str,
-    event_col: str,
-    date_col: str,
-    result_col: str,
-    df_json: str
+    cols: _ColumnMap
 ) -> List[Dict]:
-    """Cached version of athlete performance lookup."""
-    import json
-    df = pd.read_json(df_json)
-
-    athlete_data = df[
-        (df[athlete_col].astype(str) == str(athlete_id)) &
-        (df[event_col] == event)
-    ]
-
-    if athlete_data.empty:
-        return []
-
-    athlete_data = athlete_data.copy()
-    athlete_data[date_col] = pd.to_datetime(athlete_data[date_col], errors='coerce')
-    athlete_data = athlete_data.sort_values(date_col, ascending=False).head(limit)
-
-    performances = []
-    for _, row in athlete_data.iterrows():
-        result = row.get(result_col) or row.get('Result_numeric')
-        if pd.notna(result):
-            performances.append({
-                'date': str(row[date_col]),
-                'result': float(result),
-                'competition': str(row.get('Competition', row.get('competitionname', 'Unknown')))
-            })
-
-    return performances
-
+    """
+    Cached version of athlete performance lookup.
 
-def get_athlete_recent_performances(df: pd.DataFrame, athlete_id: str, event: str, limit: int = 10) -> List[Dict]:
-    """Get athlete's recent performances in an event (optimized)."""
-    athlete_col = 'Athlete_ID' if 'Athlete_ID' in df.columns else 'athleteid'
-    event_col = 'Event' if 'Event' in df.columns else 'eventname'
-    date_col = 'Start_Date' if 'Start_Date' in df.columns else 'competitiondate'
-    result_col = 'Result_numeric' if 'Result_numeric' in df.columns else 'result_numeric'
+    Args:
+        _df: DataFrame (underscore prefix tells Streamlit not to hash it)
+        df_key: Fingerprint of _df (from _df_fingerprint) used as the cache key
+        cols: Resolved column names for _df
+    """
+    df = _df
+    date_col, result_col, comp_col = cols.date, cols.result, cols.comp
 
     # Filter data first to reduce size before any operations
-    athlete_data = df[
-        (df[athlete_col].astype(str) == str(athlete_id)) &
-        (df[event_col] == event)
-    ]
+    athlete_data = _athlete_event_rows(df, cols.athlete, cols.event, athlete_id, event, df_key)
 
     if athlete_data.empty:
         return []
 
-    # Only copy and process the filtered subset
-    comp_col = 'Competition' if 'Competition' in df.columns else 'competitionname'
-    athlete_data = athlete_data[[date_col, result_col, comp_col]].copy()
-    athlete_data[date_col] = pd.to_datetime(athlete_data[date_col], errors='coerce')
-    athlete_data = athlete_data.dropna(subset=[result_col]).sort_values(date_col, ascending=False).head(limit)
-
-    performances = []
-    for _, row in athlete_data.iterrows():
-        performances.append({
-            'date': row[date_col],
-            'result': float(row[result_col]),
-            'competition': str(row.get(comp_col, 'Unknown'))
-        })
+    # Only process the filtered subset; dates go in a local Series rather
+    # than being written back into a copy of the frame
+    athlete_data = athlete_data[[date_col, result_col, comp_col]].dropna(subset=[result_col])
+    dates = athlete_data[date_col]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors='coerce')
+
+    # Most recent first (NaT last), by position so duplicate labels are safe
+    positions = dates.reset_index(drop=True).sort_values(ascending=False).index[:limit].to_numpy()
+    athlete_data = athlete_data.iloc[positions]
+    dates = dates.iloc[positions]
+
+    # Build the records straight from the column arrays (no per-row Series)
+    dates = dates.tolist()  # Timestamps
+    results = athlete_data[result_col].to_numpy(dtype=np.float64).tolist()
+    comps = athlete_data[comp_col].astype(str).tolist()
+
+    return [
+        {'date': d, 'result': r, 'competition': c}
+        for d, r, c in zip(dates, results, comps)
+    ]
 
-    return performances
+
+def get_athlete_recent_performances(
+    df: pd.DataFrame,
+    athlete_id: str,
+    event: str,
+    limit: int = 10,
+    cols: Optional[_ColumnMap] = None
+) -> List[Dict]:
+    """Get athlete's recent performances in an event (cached per DataFrame fingerprint)."""
+    cols = cols or _resolve_columns(df)
+    return _get_athlete_performances_cached(df, _df_fingerprint(df), str(athlete_id), event, limit, cols)
 
 
-def get_athlete_bests(df: pd.DataFrame, athlete_id: str, event: str) -> Dict:
+def get_athlete_bests(
+    df: pd.DataFrame,
+    athlete_id: str,
+    event: str,
+    cols: Optional[_ColumnMap] = None
+) -> Dict:
     """Get athlete's season best, personal best, and averages (optimized)."""
-    athlete_col = 'Athlete_ID' if 'Athlete_ID' in df.columns else 'athleteid'
-    event_col = 'Event' if 'Event' in df.columns else 'eventname'
-    date_col = 'Start_Date' if 'Start_Date' in df.columns else 'competitiondate'
-    result_col = 'Result_numeric' if 'Result_numeric' in df.columns else 'result_numeric'
+    cols = cols or _resolve_columns(df)
+    date_col, result_col = cols.date, cols.result
 
-    # Filter once and select only needed columns
-    mask = (df[athlete_col].astype(str) == str(athlete_id)) & (df[event_col] == event)
-    athlete_data = df.loc[mask, [date_col, result_col]].dropna(subset=[result_col])
+    # Look up the athlete's rows once and select only needed columns
+    athlete_data = _athlete_event_rows(df, cols.athlete, cols.event, athlete_id, event)
+    keep_cols = [date_col, result_col] + (['_year'] if '_year' in df.columns else [])
+    athlete_data = athlete_data[keep_cols].dropna(subset=[result_col])
 
     if athlete_data.empty:
         return {'sb': None, 'pb': None, 'avg': None, 'pb_date': None}
 
     event_type = get_event_type(event)
-    results = athlete_data[result_col].tolist()
+    vals = athlete_data[result_col].to_numpy(dtype=np.float64)
 
     # Personal Best (all time)
-    pb = min(results) if event_type == 'time' else max(results)
-
-    # Season Best (current year) - convert dates only for the filtered subset
-    athlete_data = athlete_data.copy()
-    athlete_data[date_col] = pd.to_datetime(athlete_data[date_col], errors='coerce')
+    pb = float(vals.min() if event_type == 'time' else vals.max())
+
+    # Season Best (current year) - dates are parsed up front by
+    # _ensure_datetime_columns; only convert (into a local Series, no frame
+    # copy) if a caller skipped that
+    dates = athlete_data[date_col]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors='coerce')
     current_year = datetime.now().year
-    season_mask = athlete_data[date_col].dt.year == current_year
-    season_data = athlete_data.loc[season_mask]
+    if '_year' in athlete_data.columns:
+        years = athlete_data['_year'].to_numpy()
+    else:
+        years = dates.dt.year.to_numpy()
+    season_vals = vals[years == current_year]
 
-    if not season_data.empty:
-        season_results = season_data[result_col].tolist()
-        sb = min(season_results) if event_type == 'time' else max(season_results)
+    if season_vals.size:
+        sb = float(season_vals.min() if event_type == 'time' else season_vals.max())
     else:
         sb = pb  # Use PB if no season results
 
-    # Average of last 5
-    recent_results = athlete_data.nlargest(5, date_col)[result_col].tolist()
-    avg = statistics.mean(recent_results) if recent_results else None
+    # Average of last 5 - O(N) partial selection on the dated rows rather
+    # than a full sort
+    date_values = dates.to_numpy(dtype='datetime64[ns]')
+    dated = np.flatnonzero(~np.isnat(date_values))
+    k = min(5, dated.size)
+    if k:
+        dates_i8 = date_values[dated].view('i8')
+        recent_vals = vals[dated[np.argpartition(dates_i8, -k)[-k:]]]
+    else:
+        recent_vals = vals[:0]
+    avg = float(recent_vals.mean()) if recent_vals.size else None
 
     # PB date
-    pb_mask = athlete_data[result_col] == pb
-    pb_date = athlete_data.loc[pb_mask, date_col].iloc[0] if pb_mask.any() else None
+    pb_pos = np.flatnonzero(vals == pb)
+    pb_date = dates.iloc[pb_pos[0]] if pb_pos.size else None
 
     return {'sb': sb, 'pb': pb, 'avg': avg, 'pb_date': pb_date}
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def _get_squad_stats_cached(
+    _df: pd.DataFrame,
+    df_key: str,
+    athlete_col: str,
+    event_col: str,
+    date_col: str,
+    result_col: str
+) -> Dict[Tuple[str, str], Dict]:
+    """
+    Season best, personal best and last 5 results for every (athlete_id,
+    event) in _df, from one sort and a few grouped aggregations.
+
+    Args:
+        _df: DataFrame (underscore prefix tells Streamlit not to hash it)
+        df_key: Fingerprint of _df (from _df_fingerprint) used as the cache key
+
+    Returns:
+        Dict of (athlete_id, event) -> {'sb', 'pb', 'recent'}, where
+        'recent' lists up to 5 results, most recent first
+    """
+    dates = _df[date_col]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors='coerce')
+    years = _df['_year'] if '_year' in _df.columns else dates.dt.year
+
+    work = pd.DataFrame({
+        'aid': _normalize_athlete_id_column(_df, df_key, athlete_col).array,
+        'event': _df[event_col].array,
+        'date': dates.array,
+        'result': _df[result_col].array,
+        'in_season': (years == datetime.now().year).to_numpy()
+    })
+    work = work[work['result'].notna()].sort_values('date', ascending=False)  # NaT last
+
+    keys = ['aid', 'event']
+    groups = work.groupby(keys, observed=True, sort=False)
+    all_time = groups['result'].agg(['min', 'max'])
+    season = work[work['in_season']].groupby(keys, observed=True, sort=False)['result'].agg(['min', 'max'])
+    season_bests = dict(zip(season.index, zip(season['min'].tolist(), season['max'].tolist())))
+    recent = groups.head(5).groupby(keys, observed=True, sort=False)['result'].agg(list).to_dict()
+
+    stats = {}
+    for key, lo, hi in zip(all_time.index, all_time['min'].tolist(), all_time['max'].tolist()):
+        is_time = get_event_type(key[1]) == 'time'
+        pb = lo if is_time else hi
+        season_lo, season_hi = season_bests.get(key, (pb, pb))  # Use PB if no season results
+        stats[key] = {
+            'sb': season_lo if is_time else season_hi,
+            'pb': pb,
+            'recent': recent.get(key, [])
+        }
+    return stats
+
+
+def _get_squad_stats(df: pd.DataFrame, cols: Optional[_ColumnMap] = None) -> Dict[Tuple[str, str], Dict]:
+    """Squad-wide bests/recent form lookup (cached per DataFrame fingerprint)."""
+    cols = cols or _resolve_columns(df)
+    return _get_squad_stats_cached(df, _df_fingerprint(df), cols.athlete, cols.event, cols.date, cols.result)
+
+
+def _compute_athlete_status(item: Tuple[str, str, Dict]) -> Dict:
+    """
+    Display values for one Prep Hub status card.
+
+    Pure computation (no Streamlit calls), so every card can be built
+    before the tab starts rendering.
+
+    Args:
+        item: (event, gender, squad stats entry with 'sb' and 'recent')
+
+    Returns:
+        Dict with formatted 'sb', numeric 'gap' to the entry standard (None if
+        unavailable) and its 'gap_text', 'last_3' results and 'form' trend
+    """
+    event, gender, stats = item
+    event_type = get_event_type(event)
+    sb = stats['sb']
+    recent = stats['recent']
+
+    # Get entry standard
+    gender_key = 'men' if gender == 'Men' or gender == 'M' else 'women'
+    standard = get_event_standard(event, 'tokyo_2025', gender_key)
+
+    card = {'sb': None, 'gap': None, 'gap_text': None, 'last_3': None, 'form': None}
+    if sb:
+        card['sb'] = format_benchmark_for_display(sb, event_type)
+        if standard:
+            card['gap'] = calculate_gap(sb, standard, event_type)
+            card['gap_text'] = format_gap(card['gap'], event_type)
+
+    if recent:
+        card['last_3'] = ', '.join(format_benchmark_for_display(r, event_type) for r in recent[:3])
+
+    if len(recent) >= 3:
+        trend = detect_trend(recent, event_type)
+        card['form'] = f"{get_trend_symbol(trend)} {trend.title()}"
+
+    return card
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _compute_athlete_statuses(items: List[Tuple[str, str, Dict]]) -> List[Dict]:
+    """
+    Build Prep Hub status cards ahead of rendering.
+
+    Cached on the card inputs: ticking a selection checkbox or pressing View
+    reruns the whole tab, and those reruns reuse the cards already built.
+    """
+    return [_compute_athlete_status(item) for item in items]
+
+
 def show_competition_prep_hub(df: pd.DataFrame):
     """
     Competition Prep Hub - Central hub for preparing athletes before championships.
@@ -261,22 +666,21 @@ def show_competition_prep_hub(df: pd.DataFrame):
 
     st.markdown("---")
 
-    # Get KSA athletes
+    # Get KSA athletes (from the projected working set)
+    df = _project_coach_view(df)
     ksa_df = get_ksa_athletes(df)
 
     if ksa_df.empty:
         st.warning("No KSA athlete data found in the database.")
         return
 
-    # Group by event
-    event_col = 'Event' if 'Event' in ksa_df.columns else 'eventname'
-    gender_col = 'Gender' if 'Gender' in ksa_df.columns else 'gender'
-    name_col = 'Athlete_Name' if 'Athlete_Name' in ksa_df.columns else 'firstname'
-    date_col = 'Start_Date' if 'Start_Date' in ksa_df.columns else 'competitiondate'
+    # Group by event - resolve column names once for the whole render
+    cols = _resolve_columns(ksa_df)
+    event_col, gender_col, name_col, date_col = cols.event, cols.gender, cols.name, cols.date
+    athlete_id_col = cols.athlete
 
     # Filter to ACTIVE athletes only (competed in last 3 years)
-    ksa_df = ksa_df.copy()  # Avoid SettingWithCopyWarning
-    ksa_df[date_col] = pd.to_datetime(ksa_df[date_col], errors='coerce')
+    ksa_df = _ensure_datetime_columns(ksa_df, date_col)
     cutoff_date = datetime.now() - timedelta(days=365 * 3)  # Last 3 years
     active_ksa_df = ksa_df[ksa_df[date_col] >= cutoff_date]
 
@@ -303,12 +707,13 @@ def show_competition_prep_hub(df: pd.DataFrame):
         event_opts = ['All Events'] + sorted(events_for_gender.tolist())
         selected_event = st.selectbox("Filter by Event", event_opts, key="prep_event")
 
-    # Filter data
-    filtered = athlete_events.copy()
+    # Filter data - AND the predicates into one numpy mask, then select once
+    keep = np.ones(len(athlete_events), dtype=bool)
     if selected_gender != 'All':
-        filtered = filtered[filtered[gender_col] == selected_gender]
+        np.logical_and(keep, (athlete_events[gender_col] == selected_gender).to_numpy(), out=keep)
     if selected_event != 'All Events':
-        filtered = filtered[filtered[event_col] == selected_event]
+        np.logical_and(keep, (athlete_events[event_col] == selected_event).to_numpy(), out=keep)
+    filtered = athlete_events if keep.all() else athlete_events[keep]
 
     # Display athletes with status cards
     st.markdown("### Athletes")
@@ -317,88 +722,84 @@ def show_competition_prep_hub(df: pd.DataFrame):
         st.info("No athletes found matching filters.")
         return
 
-    # Get standards for comparison
-    standards = TOKYO_2025_STANDARDS if '2025' in selected_champ else LA_2028_STANDARDS
+    # Bests and recent form for the whole squad, computed in one pass
+    squad_stats = _get_squad_stats(ksa_df, cols)
+
+    # Resolve every displayed athlete first, then build all status cards up
+    # front; only the rendering below touches Streamlit
+    # Name -> Athlete_ID (first row per name, as the per-name lookup did)
+    first_rows = (~ksa_df[name_col].duplicated()).to_numpy()
+    name_to_id = dict(zip(
+        ksa_df[name_col].to_numpy()[first_rows].tolist(),
+        ksa_df[athlete_id_col].to_numpy()[first_rows].tolist()
+    ))
+
+    events = sorted(filtered[event_col].unique())
+    event_rows = {}
+    card_inputs = []
+    for event in events:
+        event_athletes = filtered[filtered[event_col] == event]
+        rows = []
+        for _, row in event_athletes.iterrows():
+            athlete_name = row[name_col]
+
+            # Get athlete's best performances
+            if athlete_name in name_to_id:
+                athlete_id = name_to_id[athlete_name]
+                stats = squad_stats.get((str(athlete_id), event), {'sb': None, 'recent': []})
+                rows.append((athlete_name, athlete_id, len(card_inputs)))
+                card_inputs.append((event, row[gender_col], stats))
+        event_rows[event] = (len(event_athletes), rows)
+
+    cards = _compute_athlete_statuses(card_inputs)
 
     # Selection for bulk export
     selected_athletes = []
 
-    for event in sorted(filtered[event_col].unique()):
-        event_athletes = filtered[filtered[event_col] == event]
+    for event in events:
+        athlete_count, rows = event_rows[event]
 
-        with st.expander(f"**{event}** ({len(event_athletes)} athletes)", expanded=True):
-            for _, row in event_athletes.iterrows():
-                athlete_name = row[name_col]
-                gender = row[gender_col]
-
-                # Get athlete's best performances
-                athlete_id_col = 'Athlete_ID' if 'Athlete_ID' in ksa_df.columns else 'athleteid'
-                athlete_row = ksa_df[ksa_df[name_col] == athlete_name].iloc[0] if not ksa_df[ksa_df[name_col] == athlete_name].empty else None
-
-                if athlete_row is not None:
-                    athlete_id = athlete_row[athlete_id_col]
-                    bests = get_athlete_bests(ksa_df, athlete_id, event)
-
-                    # Get entry standard
-                    gender_key = 'men' if gender == 'Men' or gender == 'M' else 'women'
-                    standard = get_event_standard(event, 'tokyo_2025', gender_key)
-
-                    col1, col2, col3, col4, col5, col6 = st.columns([2.5, 1.5, 2, 3, 1.5, 1])
-
-                    with col1:
-                        # Ensure label is not empty to avoid Streamlit warning
-                        label = athlete_name if athlete_name and str(athlete_name).strip() else "Unknown Athlete"
-                        selected = st.checkbox(label, key=f"select_{athlete_name}_{event}")
-                        if selected:
-                            selected_athletes.append({'name': athlete_name, 'event': event, 'id': athlete_id})
-
-                    with col2:
-                        if bests['sb']:
-                            event_type = get_event_type(event)
-                            sb_formatted = format_benchmark_for_display(bests['sb'], event_type)
-                            st.caption(f"SB: {sb_formatted}")
-                        else:
-                            st.caption("SB: N/A")
+        with st.expander(f"**{event}** ({athlete_count} athletes)", expanded=True):
+            for athlete_name, athlete_id, card_idx in rows:
+                card = cards[card_idx]
 
-                    with col3:
-                        if standard and bests['sb']:
-                            gap = calculate_gap(bests['sb'], standard, get_event_type(event))
-                            if gap <= 0:
-                                st.success("Qualified")
-                            else:
-                                st.warning(f"{format_gap(gap, get_event_type(event))} to qualify")
-                        else:
-                            st.caption("Standard: N/A")
-
-                    with col4:
-                        # Show last 3 competition times
-                        performances = get_athlete_recent_performances(ksa_df, athlete_id, event, 3)
-                        if performances:
-                            event_type = get_event_type(event)
-                            times_list = [format_benchmark_for_display(p['result'], event_type) for p in performances]
-                            st.caption(f"Last 3: {', '.join(times_list)}")
-                        else:
-                            st.caption("Last 3: N/A")
-
-                    with col5:
-                        # Form trend
-                        performances_5 = get_athlete_recent_performances(ksa_df, athlete_id, event, 5)
-                        if len(performances_5) >= 3:
-                            results = [p['result'] for p in performances_5]
-                            trend = detect_trend(results, get_event_type(event))
-                            st.caption(f"{get_trend_symbol(trend)} {trend.title()}")
-                        else:
-                            st.caption("Form: N/A")
-
-                    with col6:
-                        if st.button("View", key=f"report_{athlete_name}_{event}"):
-                            st.session_state['selected_athlete_for_report'] = {
-                                'name': athlete_name,
-                                'id': athlete_id,
-                                'event': event
-                            }
-                            st.success(f"Athlete data saved. Switch to the Athlete Reports tab to view.")
-                            st.rerun()
+                col1, col2, col3, col4, col5, col6 = st.columns([2.5, 1.5, 2, 3, 1.5, 1])
+
+                with col1:
+                    # Ensure label is not empty to avoid Streamlit warning
+                    label = athlete_name if athlete_name and str(athlete_name).strip() else "Unknown Athlete"
+                    selected = st.checkbox(label, key=f"select_{athlete_name}_{event}")
+                    if selected:
+                        selected_athletes.append({'name': athlete_name, 'event': event, 'id': athlete_id})
+
+                with col2:
+                    st.caption(f"SB: {card['sb'] or 'N/A'}")
+
+                with col3:
+                    if card['gap'] is None:
+                        st.caption("Standard: N/A")
+                    elif card['gap'] <= 0:
+                        st.success("Qualified")
+                    else:
+                        st.warning(f"{card['gap_text']} to qualify")
+
+                with col4:
+                    # Show last 3 competition times
+                    st.caption(f"Last 3: {card['last_3'] or 'N/A'}")
+
+                with col5:
+                    # Form trend
+                    st.caption(card['form'] or "Form: N/A")
+
+                with col6:
+                    if st.button("View", key=f"report_{athlete_name}_{event}"):
+                        st.session_state['selected_athlete_for_report'] = {
+                            'name': athlete_name,
+                            'id': athlete_id,
+                            'event': event
+                        }
+                        st.success(f"Athlete data saved. Switch to the Athlete Reports tab to view.")
+                        st.rerun()
 
     # Store selected championship in session state for other tabs
     st.session_state['selected_championship'] = selected_champ
@@ -460,17 +861,19 @@ def show_athlete_report_cards(df: pd.DataFrame):
     else:
         standards_key = 'tokyo_2025'
 
-    # Get KSA athletes
+    # Get KSA athletes (from the projected working set)
+    df = _project_coach_view(df)
     ksa_df = get_ksa_athletes(df)
 
     if ksa_df.empty:
         st.warning("No KSA athlete data available.")
         return
 
+    cols = _resolve_columns(ksa_df)
+    ksa_df = _ensure_datetime_columns(ksa_df, cols.date)
+
     # Athlete selector
-    name_col = 'Athlete_Name' if 'Athlete_Name' in ksa_df.columns else 'firstname'
-    event_col = 'Event' if 'Event' in ksa_df.columns else 'eventname'
-    athlete_id_col = 'Athlete_ID' if 'Athlete_ID' in ksa_df.columns else 'athleteid'
+    name_col, event_col, athlete_id_col = cols.name, cols.event, cols.athlete
 
     # Check if there are athletes selected from Competition Prep Hub
     bulk_selected = st.session_state.get('bulk_report_athletes', [])
@@ -522,7 +925,7 @@ def show_athlete_report_cards(df: pd.DataFrame):
 
     # Get athlete ID
     athlete_id = athlete_data[athlete_id_col].iloc[0] if not athlete_data.empty else None
-    gender_col = 'Gender' if 'Gender' in athlete_data.columns else 'gender'
+    gender_col = cols.gender
     gender = athlete_data[gender_col].iloc[0] if gender_col in athlete_data.columns else 'Men'
     gender_key = 'men' if gender in ['Men', 'M'] else 'women'
 
@@ -533,12 +936,8 @@ def show_athlete_report_cards(df: pd.DataFrame):
     st.caption(f"Saudi Arabia | {gender}")
 
     # Pre-filter data for this athlete to speed up all subsequent lookups
-    athlete_col = 'Athlete_ID' if 'Athlete_ID' in df.columns else 'athleteid'
-    event_col_df = 'Event' if 'Event' in df.columns else 'eventname'
-    athlete_event_df = df[
-        (df[athlete_col].astype(str) == str(athlete_id)) &
-        (df[event_col_df] == selected_event)
-    ]
+    athlete_event_df = _athlete_event_rows(df, cols.athlete, cols.event, athlete_id, selected_event)
+    athlete_event_df = _ensure_datetime_columns(athlete_event_df, cols.date)
 
     # === QUALIFICATION STATUS ===
     col1, col2 = st.columns(2)
@@ -546,7 +945,7 @@ def show_athlete_report_cards(df: pd.DataFrame):
     with col1:
         st.subheader("Qualification Status")
 
-        bests = get_athlete_bests(athlete_event_df, athlete_id, selected_event)
+        bests = get_athlete_bests(athlete_event_df, athlete_id, selected_event, cols)
         event_type = get_event_type(selected_event)
 
         # Entry standard - use championship-specific standards
@@ -589,7 +988,7 @@ def show_athlete_report_cards(df: pd.DataFrame):
     with col2:
         st.subheader("Form Projection")
 
-        performances = get_athlete_recent_performances(athlete_event_df, athlete_id, selected_event, 10)
+        performances = get_athlete_recent_performances(athlete_event_df, athlete_id, selected_event, 10, cols)
 
         if len(performances) >= 3:
             results = [p['result'] for p in performances]
@@ -653,10 +1052,9 @@ def show_athlete_report_cards(df: pd.DataFrame):
     st.subheader("Recent Competition History")
 
     # Get last 5 performances with full details
-    date_col = 'Start_Date' if 'Start_Date' in athlete_event_df.columns else 'competitiondate'
-    result_col = 'Result' if 'Result' in athlete_event_df.columns else 'performance'
-    result_num_col = 'Result_numeric' if 'Result_numeric' in athlete_event_df.columns else 'result_numeric'
-    comp_col = 'Competition' if 'Competition' in athlete_event_df.columns else 'competitionname'
+    race_cols = _resolve_columns(athlete_event_df)
+    date_col, result_col = race_cols.date, race_cols.mark
+    result_num_col, comp_col = race_cols.result, race_cols.comp
 
     recent_df = athlete_event_df.sort_values(date_col, ascending=False).head(5)
 
@@ -788,7 +1186,7 @@ def show_athlete_report_cards(df: pd.DataFrame):
                 if key in benchmarks and benchmarks[key].get('average'):
                     chart_benchmarks[key] = benchmarks[key]['average']
 
-        chart = season_progression_chart(
+        chart_spec = season_progression_spec(
             performances=performances,
             benchmarks=chart_benchmarks,
             event_type=event_type,
@@ -796,7 +1194,7 @@ def show_athlete_report_cards(df: pd.DataFrame):
             width=700,
             height=350
         )
-        st.altair_chart(chart, use_container_width=True)
+        st.vega_lite_chart(spec=chart_spec, use_container_width=True)
     else:
         st.info("No performance data available for chart.")
 
@@ -824,8 +1222,8 @@ def show_athlete_report_cards(df: pd.DataFrame):
                     event_type
                 )
 
-                prob_chart = probability_gauge(probabilities)
-                st.altair_chart(prob_chart, use_container_width=True)
+                prob_spec = probability_gauge_spec(probabilities)
+                st.vega_lite_chart(spec=prob_spec, use_container_width=True)
         else:
             st.info("Insufficient data for probability calculation")
 
@@ -839,12 +1237,12 @@ def show_athlete_report_cards(df: pd.DataFrame):
                     chart_benchmarks[key] = benchmarks[key]['average']
 
             if chart_benchmarks:
-                gap_chart = gap_analysis_chart(
+                gap_spec = gap_analysis_spec(
                     athlete_performance=bests['sb'],
                     benchmarks=chart_benchmarks,
                     event_type=event_type
                 )
-                st.altair_chart(gap_chart, use_container_width=True)
+                st.vega_lite_chart(spec=gap_spec, use_container_width=True)
         else:
             st.info("Insufficient data for gap analysis")
 
@@ -855,13 +1253,152 @@ def show_athlete_report_cards(df: pd.DataFrame):
 
 
 # Asian region country codes for filtering Asian Games competitors
-ASIAN_COUNTRY_CODES = {
+ASIAN_COUNTRY_CODES = frozenset({
     'KSA', 'JPN', 'CHN', 'KOR', 'IND', 'QAT', 'BRN', 'UAE', 'KUW', 'OMA',
     'IRN', 'IRQ', 'SYR', 'JOR', 'LBN', 'PAL', 'YEM', 'THA', 'VIE', 'MAS',
     'SGP', 'INA', 'PHI', 'MYA', 'CAM', 'LAO', 'BRU', 'TLS', 'TPE', 'HKG',
     'MAC', 'MGL', 'PRK', 'PAK', 'AFG', 'BAN', 'NEP', 'SRI', 'MDV', 'BHU',
     'UZB', 'KAZ', 'KGZ', 'TJK', 'TKM', 'AUS', 'NZL'  # Oceania often compete in Asian events
-}
+})
+
+
+# Rows in the Competitor Watch "Top Competitors" table
+_TOP_COMPETITORS = 30
+
+
+@st.cache_resource(ttl=300, max_entries=16, show_spinner=False)
+def _get_event_bests_cached(
+    _df: pd.DataFrame,
+    df_key: str,
+    event: str,
+    gender: str,
+    asian_only: bool
+) -> Tuple[pd.DataFrame, Dict, pd.DataFrame, pd.DataFrame]:
+    """
+    FAT-only event slice and per-athlete bests for the Competitor Watch.
+
+    Cached as a resource so reruns share the event slice and index arrays
+    instead of unpickling a copy of them; callers only read from them.
+
+    Args:
+        _df: DataFrame (underscore prefix tells Streamlit not to hash it)
+        df_key: Fingerprint of _df (from _df_fingerprint) used as the cache key
+        event: Selected event
+        gender: Selected gender
+        asian_only: Restrict to ASIAN_COUNTRY_CODES (Asian Games/Championships)
+
+    Returns:
+        (event_data, athlete_rows, all_athlete_bests, athlete_bests) - the
+        event slice with parsed dates (most recent first), row positions of
+        each athlete in it, all-time bests per athlete, and the top
+        _TOP_COMPETITORS bests over the last 2 years, best first
+    """
+    cols = _resolve_columns(_df)
+    athlete_id_col, result_col = cols.athlete, cols.result
+    name_col, country_col, date_col = cols.name, cols.country, cols.date
+
+    # Filter to event and gender
+    event_data = _df[(_df[cols.event] == event) & (_df[cols.gender] == gender)]
+
+    # For Asian Games/Asian Championships, filter to Asian countries only
+    if asian_only:
+        event_data = event_data[event_data[country_col].isin(ASIAN_COUNTRY_CODES)]
+
+    # Remove hand times - only use FAT (Fully Automatic Timing)
+    event_data = filter_fat_times_only(event_data)
+
+    # The loader already parses Start_Date; only convert raw string dates
+    if not pd.api.types.is_datetime64_any_dtype(event_data[date_col]):
+        event_data = event_data.assign(**{date_col: pd.to_datetime(event_data[date_col], errors='coerce')})
+    event_data = event_data.sort_values(date_col, ascending=False, kind='stable')
+    athlete_rows = event_data.groupby(athlete_id_col, observed=True, sort=False).indices
+
+    # Get last 2 years of data for competitor analysis
+    cutoff_date = datetime.now() - timedelta(days=730)
+    recent_data = event_data[event_data[date_col] >= cutoff_date]
+
+    is_time = get_event_type(event) == 'time'
+    agg = {result_col: 'min' if is_time else 'max', name_col: 'first', country_col: 'first'}
+
+    # ALL athlete bests (used by the Build Custom Race List search)
+    event_data_clean = event_data.dropna(subset=[result_col, athlete_id_col])
+    all_athlete_bests = event_data_clean.groupby(athlete_id_col, observed=True).agg(agg).reset_index()
+
+    # Season bests per athlete
+    recent_data = recent_data.dropna(subset=[result_col, athlete_id_col])
+    athlete_bests = recent_data.groupby(athlete_id_col, observed=True).agg(agg).reset_index()
+    # Only the top of the table is shown - partial selection, not a full sort
+    if is_time:
+        athlete_bests = athlete_bests.nsmallest(_TOP_COMPETITORS, result_col)
+    else:
+        athlete_bests = athlete_bests.nlargest(_TOP_COMPETITORS, result_col)
+
+    return event_data, athlete_rows, all_athlete_bests, athlete_bests
+
+
+def _get_event_bests(
+    df: pd.DataFrame,
+    event: str,
+    gender: str,
+    asian_only: bool,
+    df_key: Optional[str] = None
+) -> Tuple[pd.DataFrame, Dict, pd.DataFrame, pd.DataFrame]:
+    """Competitor Watch event slice and bests (cached per DataFrame fingerprint)."""
+    return _get_event_bests_cached(df, df_key or _df_fingerprint(df), event, gender, asian_only)
+
+
+@st.cache_resource(ttl=300, max_entries=8, show_spinner=False)
+def _lowercase_names(_names: pd.Series, names_key: str) -> np.ndarray:
+    """
+    Lower-cased names as a fixed-width str array for substring search.
+
+    Cached as a resource so typing in the search box (a rerun per
+    keystroke) doesn't re-lowercase every name.
+
+    Args:
+        _names: Name column (underscore prefix tells Streamlit not to hash it)
+        names_key: Cache key identifying the frame _names came from
+    """
+    return _names.fillna('').astype(str).str.lower().to_numpy(dtype=str)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _race_list_csv(columns: Tuple[str, ...], rows: Tuple[Tuple, ...]) -> str:
+    """
+    CSV export of the custom race list table.
+
+    Keyed on the table contents, so the CSV is only re-rendered when the
+    race list changes rather than on every rerun of the page.
+    """
+    return pd.DataFrame(list(rows), columns=list(columns)).to_csv(index=False)
+
+
+def _add_to_race_list(selected: List[str], options: List[Dict]) -> int:
+    """
+    Append the selected athletes to the session's custom race list.
+
+    Args:
+        selected: Display strings picked in a multiselect
+        options: Athlete dicts offered by that multiselect (with 'id', 'display')
+
+    Returns:
+        Number of athletes added (ones already in the list are skipped)
+    """
+    race_list = st.session_state.setdefault('custom_race_list', [])
+    # IDs already in the list, kept alongside it for O(1) duplicate checks
+    if 'custom_race_list_ids' not in st.session_state:
+        st.session_state['custom_race_list_ids'] = {a['id'] for a in race_list}
+    race_ids = st.session_state['custom_race_list_ids']
+
+    by_display = {a['display']: a for a in options}
+    added = 0
+    for sel in selected:
+        athlete = by_display.get(sel)
+        if athlete is not None and athlete['id'] not in race_ids:
+            race_list.append(athlete)
+            race_ids.add(athlete['id'])
+            added += 1
+    return added
 
 
 def show_competitor_watch(df: pd.DataFrame):
@@ -876,16 +1413,16 @@ def show_competitor_watch(df: pd.DataFrame):
     """
     st.title("Competitor Watch")
 
+    # Work on the projected frame - country/event/gender are categoricals
+    # there, so the region isin and equality filters compare integer codes
+    df = _project_coach_view(df)
+
     # Column mappings
-    event_col = 'Event' if 'Event' in df.columns else 'eventname'
-    gender_col = 'Gender' if 'Gender' in df.columns else 'gender'
-    comp_id_col = 'Competition_ID' if 'Competition_ID' in df.columns else 'competitionid'
-    comp_name_col = 'Competition' if 'Competition' in df.columns else 'competitionname'
-    name_col = 'Athlete_Name' if 'Athlete_Name' in df.columns else 'firstname'
-    result_col = 'Result_numeric' if 'Result_numeric' in df.columns else 'result_numeric'
-    date_col = 'Start_Date' if 'Start_Date' in df.columns else 'competitiondate'
-    country_col = 'Athlete_CountryCode' if 'Athlete_CountryCode' in df.columns else 'nationality'
-    athlete_id_col = 'Athlete_ID' if 'Athlete_ID' in df.columns else 'athleteid'
+    cols = _resolve_columns(df)
+    event_col, gender_col = cols.event, cols.gender
+    comp_id_col, comp_name_col = cols.comp_id, cols.comp
+    name_col, result_col, date_col = cols.name, cols.result, cols.date
+    country_col, athlete_id_col = cols.country, cols.athlete
 
     # Get championship context from Comp Prep tab (if set)
     default_champ = st.session_state.get('selected_championship', 'Asian Games 2026')
@@ -919,6 +1456,9 @@ def show_competitor_watch(df: pd.DataFrame):
         st.info("Please select an event.")
         return
 
+    # Resolved once for the page - every gap, format and sort below uses it
+    event_type = get_event_type(selected_event)
+
     # Championship info
     champ_info = UPCOMING_CHAMPIONSHIPS.get(selected_championship, {})
     champ_date = champ_info.get('date')
@@ -930,8 +1470,9 @@ def show_competitor_watch(df: pd.DataFrame):
 
     st.markdown("---")
 
-    # Get ALL KSA athletes for comparison
-    ksa_df = get_ksa_athletes(df)
+    # Get ALL KSA athletes for comparison (dates parsed as in the Prep Hub,
+    # so both pages share the same cached KSA frame and squad stats)
+    ksa_df = _ensure_datetime_columns(get_ksa_athletes(df), date_col)
     ksa_in_event = ksa_df[(ksa_df[event_col] == selected_event) & (ksa_df[gender_col] == selected_gender)]
 
     # Get unique KSA athletes in this event
@@ -942,8 +1483,6 @@ def show_competitor_watch(df: pd.DataFrame):
     ksa_id = None
 
     if not ksa_athletes_unique.empty:
-        event_type = get_event_type(selected_event)
-
         # If multiple KSA athletes, let user select which one to compare
         ksa_athlete_names = ksa_athletes_unique[name_col].unique().tolist()
 
@@ -973,16 +1512,16 @@ def show_competitor_watch(df: pd.DataFrame):
             ksa_athlete = ksa_athlete_names[0]
             ksa_id = ksa_athletes_unique[athlete_id_col].iloc[0]
 
-        ksa_event_data = df[(df[athlete_id_col].astype(str) == str(ksa_id)) & (df[event_col] == selected_event)]
-        ksa_bests = get_athlete_bests(ksa_event_data, ksa_id, selected_event)
+        # SB/PB for every KSA athlete from the squad-wide grouped stats (one
+        # cached pass over the KSA subset, shared with the Prep Hub)
+        squad_stats = _get_squad_stats(ksa_df)
+        no_bests = {'sb': None, 'pb': None}
+        ksa_bests = squad_stats.get((str(ksa_id), selected_event), no_bests)
 
         # Show all KSA athletes summary
         ksa_summary_data = []
-        for _, ksa_row in ksa_athletes_unique.iterrows():
-            kid = ksa_row[athlete_id_col]
-            kname = ksa_row[name_col]
-            k_event_data = df[(df[athlete_id_col].astype(str) == str(kid)) & (df[event_col] == selected_event)]
-            k_bests = get_athlete_bests(k_event_data, kid, selected_event)
+        for kid, kname in ksa_athletes_unique[[athlete_id_col, name_col]].itertuples(index=False, name=None):
+            k_bests = squad_stats.get((str(kid), selected_event), no_bests)
             ksa_summary_data.append({
                 'Athlete': kname,
                 'SB': format_benchmark_for_display(k_bests['sb'], event_type) if k_bests['sb'] else 'N/A',
@@ -1011,94 +1550,68 @@ def show_competitor_watch(df: pd.DataFrame):
     st.subheader(f"Top Competitors - {selected_event} ({selected_gender})")
     st.caption(f"Athletes likely to compete at {selected_championship}")
 
-    # Filter to event and gender
-    event_data = df[(df[event_col] == selected_event) & (df[gender_col] == selected_gender)].copy()
-
-    # For Asian Games/Asian Championships, filter to Asian countries only
+    # Filter to event and gender, FAT only; per-athlete bests (cached across reruns)
     is_asian_event = 'Asian' in selected_championship
+    df_key = _df_fingerprint(df)
+    event_data, athlete_rows, all_athlete_bests, athlete_bests = _get_event_bests(
+        df, selected_event, selected_gender, is_asian_event, df_key
+    )
+
+    # For Asian Games/Asian Championships, only Asian countries are included
     if is_asian_event:
-        event_data = event_data[event_data[country_col].isin(ASIAN_COUNTRY_CODES)]
         st.caption(f"Showing Asian athletes only (eligible for {selected_championship})")
 
-    # Remove hand times - only use FAT (Fully Automatic Timing)
-    event_data = filter_fat_times_only(event_data)
-
-    event_data[date_col] = pd.to_datetime(event_data[date_col], errors='coerce')
-
-    # Get last 2 years of data for competitor analysis
-    cutoff_date = datetime.now() - timedelta(days=730)
-    recent_data = event_data[event_data[date_col] >= cutoff_date]
-
-    if recent_data.empty:
+    if athlete_bests.empty:
         st.info("No recent competitor data available (FAT times only).")
         return
 
-    event_type = get_event_type(selected_event)
-
-    # Pre-compute ALL athlete bests once for fast search (used by Build Custom Race List)
-    event_data_clean = event_data.dropna(subset=[result_col, athlete_id_col])
-    if event_type == 'time':
-        all_athlete_bests = event_data_clean.groupby(athlete_id_col, observed=True).agg({
-            result_col: 'min',
-            name_col: 'first',
-            country_col: 'first'
-        }).reset_index()
-    else:
-        all_athlete_bests = event_data_clean.groupby(athlete_id_col, observed=True).agg({
-            result_col: 'max',
-            name_col: 'first',
-            country_col: 'first'
-        }).reset_index()
-
-    # Get season bests per athlete
-    recent_data = recent_data.dropna(subset=[result_col, athlete_id_col])
-
-    if event_type == 'time':
-        athlete_bests = recent_data.groupby(athlete_id_col, observed=True).agg({
-            result_col: 'min',
-            name_col: 'first',
-            country_col: 'first'
-        }).reset_index()
-        athlete_bests = athlete_bests.sort_values(result_col, ascending=True)
-    else:
-        athlete_bests = recent_data.groupby(athlete_id_col, observed=True).agg({
-            result_col: 'max',
-            name_col: 'first',
-            country_col: 'first'
-        }).reset_index()
-        athlete_bests = athlete_bests.sort_values(result_col, ascending=False)
-
     # Build competitor data
     competitors_data = []
 
-    for i, row in athlete_bests.head(30).iterrows():
-        athlete_id = row[athlete_id_col]
-        athlete_name = row[name_col]
-        country = row[country_col]
-        sb = row[result_col]
-
-        # Get PB from all-time data
-        all_time_data = event_data[event_data[athlete_id_col] == athlete_id]
-        if event_type == 'time':
-            pb = all_time_data[result_col].min()
-        else:
-            pb = all_time_data[result_col].max()
-
-        pb_row = all_time_data[all_time_data[result_col] == pb]
-        pb_date = pb_row[date_col].iloc[0] if not pb_row.empty else None
-
-        # Get recent form (last 3 competitions)
-        recent = all_time_data.sort_values(date_col, ascending=False).head(3)
-        recent_form = recent[result_col].tolist()
-
-        # Get last 3 competition names
-        comp_col = 'Competition' if 'Competition' in all_time_data.columns else 'competitionname'
-        last_3_comps = recent[comp_col].tolist() if comp_col in recent.columns else []
+    # PB, PB date and last 3 results for the top 30, from one grouped pass
+    # over their rows (looked up in the cached athlete -> rows index)
+    top_bests = athlete_bests
+    top_positions = [athlete_rows[a] for a in top_bests[athlete_id_col].tolist() if a in athlete_rows]
+    # Positional index so the grouped argmin/argmax below are row positions
+    top_data = (
+        event_data.take(np.sort(np.concatenate(top_positions))) if top_positions else event_data.iloc[:0]
+    ).reset_index(drop=True)
+    by_athlete = top_data.groupby(athlete_id_col, observed=True, sort=False)[result_col]
+
+    # PB row per athlete in one argmin/argmax pass - the first hit is the
+    # most recent, since event_data is most-recent-first
+    pb_pos = by_athlete.idxmin() if event_type == 'time' else by_athlete.idxmax()
+    pb_ids, pb_pos = pb_pos.index.tolist(), pb_pos.to_numpy(dtype=np.intp)
+    pbs = dict(zip(pb_ids, top_data[result_col].to_numpy()[pb_pos].tolist()))
+    pb_dates = dict(zip(pb_ids, top_data[date_col].iloc[pb_pos].tolist()))
+
+    # event_data is already most-recent-first, so head(3) is the last 3
+    recent3 = top_data.groupby(athlete_id_col, observed=True, sort=False).head(3)
+    recent3_by_athlete = recent3.groupby(athlete_id_col, observed=True, sort=False)
+    recent_forms = recent3_by_athlete[result_col].agg(list).to_dict()
+    recent_means = recent3_by_athlete[result_col].mean().to_dict()
+    recent_comps = recent3_by_athlete[comp_name_col].agg(list).to_dict() if comp_name_col in recent3.columns else {}
+
+    # SB/PB/average display strings for the whole table in one vectorized pass
+    top_ids = top_bests[athlete_id_col].tolist()
+    sb_display = format_benchmarks_for_display(top_bests[result_col].to_numpy(), event_type)
+    pb_display = format_benchmarks_for_display([pbs.get(a, np.nan) for a in top_ids], event_type)
+    avg_display = format_benchmarks_for_display([recent_means.get(a, np.nan) for a in top_ids], event_type)
+
+    top_rows = top_bests[[athlete_id_col, name_col, country_col, result_col]].itertuples(index=False, name=None)
+    for (athlete_id, athlete_name, country, sb), sb_str, pb_str, avg_str in zip(
+        top_rows, sb_display, pb_display, avg_display
+    ):
+        # PB date from all-time data
+        pb_date = pb_dates.get(athlete_id)
+
+        # Recent form (last 3 competitions)
+        recent_form = recent_forms.get(athlete_id, [])
+
+        # Last 3 competition names
+        last_3_comps = recent_comps.get(athlete_id, [])
         last_3_comps_str = ", ".join([str(c)[:20] for c in last_3_comps[:3]]) if last_3_comps else "N/A"
 
-        # Calculate average performance
-        avg_perf = statistics.mean(recent_form) if recent_form else None
-
         # Calculate gap from KSA athlete
         gap = None
         gap_formatted = "N/A"
@@ -1113,11 +1626,11 @@ def show_competitor_watch(df: pd.DataFrame):
             'Rank': len(competitors_data) + 1,
             'Athlete': athlete_name,
             'Country': country,
-            'SB': format_benchmark_for_display(sb, event_type) if pd.notna(sb) else 'N/A',
+            'SB': sb_str,
             'SB_raw': sb,
-            'PB': format_benchmark_for_display(pb, event_type) if pd.notna(pb) else 'N/A',
+            'PB': pb_str,
             'PB Date': pb_date.strftime('%b %Y') if pd.notna(pb_date) else 'N/A',
-            'Avg': format_benchmark_for_display(avg_perf, event_type) if avg_perf else 'N/A',
+            'Avg': avg_str,
             'Last 3 Comps': last_3_comps_str,
             'Gap': gap_formatted,
             'Gap_raw': gap,
@@ -1201,13 +1714,15 @@ def show_competitor_watch(df: pd.DataFrame):
     else:
         top_sorted = filtered_bests.nlargest(top_n, result_col)
 
-    for _, row in top_sorted.iterrows():
+    top_best_display = format_benchmarks_for_display(top_sorted[result_col].to_numpy(), event_type)
+    top_rows = top_sorted[[athlete_id_col, name_col, country_col, result_col]].itertuples(index=False, name=None)
+    for (aid, name, country, best), best_str in zip(top_rows, top_best_display):
         top_competitors_for_select.append({
-            'id': row[athlete_id_col],
-            'name': row[name_col],
-            'country': row[country_col],
-            'best': row[result_col],
-            'display': f"{row[name_col]} ({row[country_col]}) - {format_benchmark_for_display(row[result_col], event_type)}"
+            'id': aid,
+            'name': name,
+            'country': country,
+            'best': best,
+            'display': f"{name} ({country}) - {best_str}"
         })
 
     # Two methods: Quick select from top competitors OR search
@@ -1226,41 +1741,42 @@ def show_competitor_watch(df: pd.DataFrame):
 
         if quick_select:
             if st.button("Add Selected", key="add_quick_select"):
-                if 'custom_race_list' not in st.session_state:
-                    st.session_state['custom_race_list'] = []
-                added = 0
-                for sel in quick_select:
-                    for a in top_competitors_for_select:
-                        if a['display'] == sel:
-                            # Check not already in list
-                            existing_ids = [x['id'] for x in st.session_state['custom_race_list']]
-                            if a['id'] not in existing_ids:
-                                st.session_state['custom_race_list'].append(a)
-                                added += 1
+                added = _add_to_race_list(quick_select, top_competitors_for_select)
                 if added:
                     st.success(f"Added {added} athlete(s)")
                     st.rerun()
 
     with col_method2:
         st.markdown("**Search All Athletes**")
-        search_term = st.text_input("Type name to search", key="competitor_search", placeholder="e.g. Bolt", label_visibility="collapsed")
+        # Inside a form so the page reruns once per search (Enter / Search),
+        # not on every keystroke; the submitted term persists across reruns
+        with st.form("competitor_search_form"):
+            search_term = st.text_input("Type name to search", key="competitor_search", placeholder="e.g. Bolt", label_visibility="collapsed")
+            st.form_submit_button("Search")
 
         if search_term and len(search_term) >= 2:
-            # Search in pre-computed all_athlete_bests
-            search_results = all_athlete_bests[
-                all_athlete_bests[name_col].str.contains(search_term, case=False, na=False)
-            ].head(20)
+            # Plain substring search over pre-lowercased names of all_athlete_bests
+            names_lower = _lowercase_names(
+                all_athlete_bests[name_col],
+                f"{df_key}|{selected_event}|{selected_gender}|{is_asian_event}"
+            )
+            hits = np.flatnonzero(np.char.find(names_lower, search_term.lower()) >= 0)[:20]
+            search_results = all_athlete_bests.iloc[hits]
 
             if not search_results.empty:
+                search_best_display = format_benchmarks_for_display(search_results[result_col].to_numpy(), event_type)
+                search_rows = search_results[[athlete_id_col, name_col, country_col, result_col]].itertuples(
+                    index=False, name=None
+                )
                 search_athletes = [
                     {
-                        'id': row[athlete_id_col],
-                        'name': row[name_col],
-                        'country': row[country_col],
-                        'best': row[result_col],
-                        'display': f"{row[name_col]} ({row[country_col]}) - {format_benchmark_for_display(row[result_col], event_type)}"
+                        'id': aid,
+                        'name': name,
+                        'country': country,
+                        'best': best,
+                        'display': f"{name} ({country}) - {best_str}"
                     }
-                    for _, row in search_results.iterrows()
+                    for (aid, name, country, best), best_str in zip(search_rows, search_best_display)
                 ]
 
                 selected_search = st.multiselect(
@@ -1271,16 +1787,7 @@ def show_competitor_watch(df: pd.DataFrame):
                 )
 
                 if selected_search and st.button("Add from Search", key="add_search_select"):
-                    if 'custom_race_list' not in st.session_state:
-                        st.session_state['custom_race_list'] = []
-                    added = 0
-                    for sel in selected_search:
-                        for a in search_athletes:
-                            if a['display'] == sel:
-                                existing_ids = [x['id'] for x in st.session_state['custom_race_list']]
-                                if a['id'] not in existing_ids:
-                                    st.session_state['custom_race_list'].append(a)
-                                    added += 1
+                    added = _add_to_race_list(selected_search, search_athletes)
                     if added:
                         st.success(f"Added {added} athlete(s)")
                         st.rerun()
@@ -1313,17 +1820,71 @@ def show_competitor_watch(df: pd.DataFrame):
         with col1:
             if st.button("Clear Race List", key="clear_race_list"):
                 st.session_state['custom_race_list'] = []
+                st.session_state['custom_race_list_ids'] = set()
                 st.rerun()
         with col2:
             st.download_button(
                 "Export Race List",
-                data=race_df.to_csv(index=False),
+                data=_race_list_csv(
+                    tuple(race_df.columns), tuple(race_df.itertuples(index=False, name=None))
+                ),
                 file_name=f"race_list_{selected_event}_{selected_gender}.csv",
                 mime="text/csv",
                 key="export_race_list"
             )
 
 
+# Bulk queue keys -> report fields, with the value used when a key is missing
+_BULK_REPORT_FIELDS = {'sb': 'season_best', 'pb': 'personal_best'}
+_BULK_REPORT_DEFAULTS = {'season_best': '-', 'personal_best': '-', 'projected': '-', 'trend': 'stable'}
+
+
+def _bulk_athlete_records(athletes: List[Dict]) -> List[Dict]:
+    """Simplified report data for every queued bulk-export athlete, built in one pass."""
+    bulk_df = (
+        pd.DataFrame(athletes)
+        .rename(columns=_BULK_REPORT_FIELDS)
+        .reindex(columns=['name', 'event', *_BULK_REPORT_DEFAULTS])
+        .astype(object)
+        .fillna(_BULK_REPORT_DEFAULTS)
+    )
+    bulk_df.insert(2, 'country', 'KSA')
+    return bulk_df.to_dict('records')
+
+
+def _bulk_reports_zip(athletes: List[Dict]) -> Tuple[bytes, int, List[Tuple[Dict, Exception]]]:
+    """
+    Render the bulk export queue's (simplified) HTML reports into one
+    deflated ZIP archive.
+
+    Reports are rendered one at a time and their chunks streamed straight
+    into their ZIP entry, so only one report is ever held in memory next
+    to the compressed archive.
+
+    Returns:
+        (ZIP bytes, number of reports written, [(athlete, error), ...] for
+        reports that failed to render)
+    """
+    report_gen = _load_report_generator()
+    written = 0
+    failures = []
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
+        for athlete, ath_data in zip(athletes, _bulk_athlete_records(athletes)):
+            try:
+                # Build before opening the entry, so a failed report leaves no empty file
+                parts = report_gen.html_report_parts(ath_data, [], {}, {})
+            except Exception as e:
+                failures.append((athlete, e))
+                continue
+            entry_name = f"{ath_data['name'].replace(' ', '_')}_{ath_data['event']}_report.html"
+            with zf.open(entry_name, 'w') as entry:
+                for part in parts:
+                    entry.write(part.encode('utf-8'))
+            written += 1
+    return buffer.getvalue(), written, failures
+
+
 def show_export_center(df: pd.DataFrame):
     """
     Export Center - Generate PDF/HTML reports for coaches.
@@ -1337,8 +1898,9 @@ def show_export_center(df: pd.DataFrame):
     st.title("Export Center")
 
     # Check dependencies
-    if REPORT_GEN_AVAILABLE:
-        pdf_available, pdf_msg = check_dependencies()
+    report_gen = _load_report_generator() if REPORT_GEN_AVAILABLE else None
+    if report_gen is not None:
+        pdf_available, pdf_msg = report_gen.check_dependencies()
     else:
         pdf_available = False
         pdf_msg = "Report generator module not loaded"
@@ -1362,13 +1924,15 @@ def show_export_center(df: pd.DataFrame):
     # Individual Export Section
     st.subheader("Export Individual Report")
 
-    # Get KSA athletes for export
+    # Get KSA athletes for export - from the projected working set, so this
+    # is the same cached KSA subset the other Coach View tabs use
+    df = _project_coach_view(df)
     ksa_data = get_ksa_athletes(df)
 
     if not ksa_data.empty:
         # Build athlete options
-        name_col = 'Athlete_Name' if 'Athlete_Name' in ksa_data.columns else 'firstname'
-        event_col = 'Event' if 'Event' in ksa_data.columns else 'eventname'
+        export_cols = _resolve_columns(ksa_data)
+        name_col, event_col = export_cols.name, export_cols.event
 
         athletes_export = ksa_data.groupby([name_col, event_col], observed=True).size().reset_index()
         athlete_options = [f"{row[name_col]} - {row[event_col]}" for _, row in athletes_export.iterrows()]
@@ -1390,7 +1954,7 @@ def show_export_center(df: pd.DataFrame):
                 with st.spinner("Generating report..."):
                     try:
                         # Get athlete data
-                        athlete_id_col = 'Athlete_ID' if 'Athlete_ID' in ksa_data.columns else 'athleteid'
+                        athlete_id_col = export_cols.athlete
                         athlete_row = ksa_data[ksa_data[name_col] == athlete_name].iloc[0]
                         athlete_id = str(athlete_row.get(athlete_id_col, ''))
 
@@ -1424,7 +1988,7 @@ def show_export_center(df: pd.DataFrame):
                             probabilities = {'medal': 0, 'final': 0, 'semi': 0, 'heat': 0}
 
                         # Build athlete data dict for report
-                        sb_col = 'Result_numeric' if 'Result_numeric' in ksa_data.columns else 'result_numeric'
+                        sb_col = export_cols.result
                         athlete_events = ksa_data[(ksa_data[name_col] == athlete_name) & (ksa_data[event_col] == event_name)]
                         season_best = athlete_events[sb_col].min() if event_type == 'time' else athlete_events[sb_col].max()
                         personal_best = athlete_events[sb_col].min() if event_type == 'time' else athlete_events[sb_col].max()
@@ -1453,7 +2017,7 @@ def show_export_center(df: pd.DataFrame):
 
                         # Generate report
                         if export_format == "HTML":
-                            html_content = generate_html_report(
+                            html_content = report_gen.generate_html_report(
                                 athlete_data, perfs, formatted_benchmarks, probabilities, competitors
                             )
                             st.download_button(
@@ -1470,7 +2034,7 @@ def show_export_center(df: pd.DataFrame):
 
                         elif export_format == "PDF":
                             if pdf_available:
-                                generator = AthleteReportGenerator()
+                                generator = report_gen.AthleteReportGenerator()
                                 pdf_bytes = generator.generate_athlete_report(
                                     athlete_data, perfs, formatted_benchmarks, probabilities, competitors
                                 )
@@ -1502,46 +2066,46 @@ def show_export_center(df: pd.DataFrame):
         for athlete in bulk_athletes:
             st.caption(f"- {athlete['name']} ({athlete['event']})")
 
-        col1, col2 = st.columns(2)
+        col1, col2, col3 = st.columns(3)
         with col1:
             if st.button("Generate All Reports (HTML)", key="bulk_html"):
                 with st.spinner(f"Generating {len(bulk_athletes)} reports..."):
-                    # Generate each report
-                    all_reports = []
-                    for ath in bulk_athletes:
-                        try:
-                            # Simplified data for bulk export
-                            ath_data = {
-                                'name': ath['name'],
-                                'event': ath['event'],
-                                'country': 'KSA',
-                                'season_best': ath.get('sb', '-'),
-                                'personal_best': ath.get('pb', '-'),
-                                'projected': ath.get('projected', '-'),
-                                'trend': ath.get('trend', 'stable')
-                            }
-                            html = generate_html_report(ath_data, [], {}, {})
-                            all_reports.append({
-                                'name': ath['name'],
-                                'event': ath['event'],
-                                'content': html
-                            })
-                        except Exception as e:
-                            st.warning(f"Failed to generate report for {ath['name']}: {e}")
-
-                    if all_reports:
-                        # Combine into ZIP (simplified - just show first)
-                        st.success(f"Generated {len(all_reports)} reports")
-                        for report in all_reports[:3]:  # Show first 3
-                            st.download_button(
-                                label=f"Download {report['name']}",
-                                data=report['content'],
-                                file_name=f"{report['name'].replace(' ', '_')}_{report['event']}_report.html",
-                                mime="text/html",
-                                key=f"bulk_dl_{report['name']}_{report['event']}"
-                            )
+                    # Reports are streamed into the ZIP in queue order
+                    zip_bytes, report_count, failures = _bulk_reports_zip(bulk_athletes)
+                    for ath, e in failures:
+                        st.warning(f"Failed to generate report for {ath['name']}: {e}")
+
+                    if report_count:
+                        # One ZIP download for the whole queue
+                        st.success(f"Generated {report_count} reports")
+                        st.download_button(
+                            label="Download All Reports (ZIP)",
+                            data=zip_bytes,
+                            file_name="coach_reports.zip",
+                            mime="application/zip",
+                            key="bulk_dl_zip"
+                        )
 
         with col2:
+            if st.button("Generate All Reports (PDF)", key="bulk_pdf", disabled=not pdf_available):
+                with st.spinner(f"Generating {len(bulk_athletes)} reports..."):
+                    try:
+                        # One document build for the whole queue
+                        pdf_bytes = report_gen.AthleteReportGenerator().generate_athlete_reports_batch(
+                            [{'athlete_data': ath_data} for ath_data in _bulk_athlete_records(bulk_athletes)]
+                        )
+                        st.success(f"Generated {len(bulk_athletes)} reports")
+                        st.download_button(
+                            label="Download All Reports (PDF)",
+                            data=pdf_bytes,
+                            file_name="coach_reports.pdf",
+                            mime="application/pdf",
+                            key="bulk_dl_pdf"
+                        )
+                    except Exception as e:
+                        st.error(f"Error generating reports: {str(e)}")
+
+        with col3:
             if st.button("Clear Queue", key="clear_queue"):
                 st.session_state['bulk_report_athletes'] = []
                 st.rerun()
@@ -1566,41 +2130,62 @@ def show_export_center(df: pd.DataFrame):
         """)
 
 
-def render_coach_view(df: pd.DataFrame):
-    """
-    Main entry point for Coach View.
-    Renders all Coach View tabs.
-    """
-    # Saudi Arabia header
-    st.markdown("""
+# Saudi Arabia header shown above the Coach View tabs
+_HEADER_HTML = """
     <div style="display: flex; align-items: center; gap: 15px; margin-bottom: 20px;">
         <div>
             <h1 style="color: #006C35; margin: 0;">Saudi Athletics</h1>
             <p style="color: #888; margin: 0;">Coach Dashboard - Performance Analysis</p>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+
+# Tab bodies that only read shared state - a widget change inside one of
+# them reruns just that tab (the Prep Hub stays on full reruns, since its
+# selections feed the other tabs)
+_athlete_report_cards_fragment = _fragment(show_athlete_report_cards)
+_competitor_watch_fragment = _fragment(show_competitor_watch)
+_export_center_fragment = _fragment(show_export_center)
+
+# Coach View tabs: label -> renderer (called with the projected frame)
+_COACH_TABS = {
+    "Competition Prep": show_competition_prep_hub,
+    "Athlete Reports": _athlete_report_cards_fragment,
+    "Competitor Watch": _competitor_watch_fragment,
+    "Export Center": _export_center_fragment,
+}
+_COACH_TAB_RENDERERS = tuple(_COACH_TABS.values())
+_COACH_TAB_LABELS = list(_COACH_TABS) + (["AI Analytics"] if AI_ANALYTICS_AVAILABLE else [])
+
+
+def render_coach_view(df: pd.DataFrame, data_key: Optional[str] = None):
+    """
+    Main entry point for Coach View.
+    Renders all Coach View tabs.
+
+    Args:
+        df: Full results DataFrame
+        data_key: frame_content_key of df, computed once by the data loader;
+            hashed here (once per rerun) if not given
+    """
+    if data_key:
+        _remember_fingerprint(df, data_key)
+
+    # Saudi Arabia header
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
     # Coach View navigation - tab-based
-    coach_tab_labels = [
-        "Competition Prep",
-        "Athlete Reports",
-        "Competitor Watch",
-        "Export Center",
-    ]
+    coach_tabs = st.tabs(_COACH_TAB_LABELS)
+
+    # Project (and categorize) the source frame once; the tabs below
+    # receive the shared projection instead of each re-fingerprinting
+    # and re-projecting the full df. AI Analytics keeps the full frame.
+    coach_df = _project_coach_view(df)
+
+    for tab, render_tab in zip(coach_tabs, _COACH_TAB_RENDERERS):
+        with tab:
+            render_tab(coach_df)
     if AI_ANALYTICS_AVAILABLE:
-        coach_tab_labels.append("AI Analytics")
-
-    coach_tabs = st.tabs(coach_tab_labels)
-
-    with coach_tabs[0]:
-        show_competition_prep_hub(df)
-    with coach_tabs[1]:
-        show_athlete_report_cards(df)
-    with coach_tabs[2]:
-        show_competitor_watch(df)
-    with coach_tabs[3]:
-        show_export_center(df)
-    if AI_ANALYTICS_AVAILABLE and len(coach_tabs) > 4:
-        with coach_tabs[4]:
+        with coach_tabs[len(_COACH_TAB_RENDERERS)]:
             render_ai_analytics(df)
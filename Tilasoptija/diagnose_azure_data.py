@@ -7,8 +7,108 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from azure_db import query_data, get_connection_mode
+from functools import lru_cache
 import pandas as pd
 import re
+import sys
+
+
+def _cached_query(func):
+    """
+    Cache a diagnostic query helper.
+
+    Under Streamlit the result is shared across reruns for 10 minutes;
+    from the command line it is memoized for the life of the process.
+    """
+    if 'streamlit' in sys.modules:
+        import streamlit as st
+        return st.cache_data(ttl=600, show_spinner=False)(func)
+    return lru_cache(maxsize=None)(func)
+
+
+# Low-cardinality text columns returned by the diagnostic queries
+_CATEGORY_COLUMNS = ('Event', 'Gender', 'Competition')
+
+
+def _compact(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast a diagnostic result: int32 counts, categorical text columns."""
+    downcast = {col: 'category' for col in _CATEGORY_COLUMNS if col in df.columns}
+    if 'count' in df.columns:
+        downcast['count'] = 'int32'
+    return df.astype(downcast) if downcast else df
+
+
+@_cached_query
+def _total_rows() -> pd.DataFrame:
+    return query_data("SELECT COUNT(*) as total FROM athletics_data")
+
+
+@_cached_query
+def _distinct_event_count() -> pd.DataFrame:
+    return query_data("SELECT COUNT(DISTINCT Event) as n FROM athletics_data")
+
+
+@_cached_query
+def _first_events() -> pd.DataFrame:
+    return _compact(query_data("""
+        SELECT TOP 20 Event
+        FROM (SELECT DISTINCT Event FROM athletics_data) x
+        ORDER BY Event
+    """))
+
+
+# Para classification code: T or F followed by 2 digits (11-99)
+_PARA_RE = re.compile(r'\b[TF]\d{2}\b')
+
+# Server-side equivalent of is_para_athletics_event (T/F + two digits)
+_PARA_SQL_MATCH = "PATINDEX('%[TF][0-9][0-9]%', Event) > 0"
+
+
+@_cached_query
+def _para_split() -> pd.DataFrame:
+    """Para vs regular event and record counts, classified in the database."""
+    return query_data(f"""
+        SELECT
+            SUM(CASE WHEN {_PARA_SQL_MATCH} THEN 1 ELSE 0 END) as para_events,
+            SUM(CASE WHEN {_PARA_SQL_MATCH} THEN 0 ELSE 1 END) as regular_events,
+            SUM(CASE WHEN {_PARA_SQL_MATCH} THEN count ELSE 0 END) as para_count,
+            SUM(CASE WHEN {_PARA_SQL_MATCH} THEN 0 ELSE count END) as regular_count
+        FROM (SELECT Event, COUNT(*) as count FROM athletics_data GROUP BY Event) t
+    """)
+
+
+@_cached_query
+def _para_event_sample() -> pd.DataFrame:
+    return _compact(query_data(f"""
+        SELECT TOP 10 Event, COUNT(*) as count
+        FROM athletics_data
+        WHERE {_PARA_SQL_MATCH}
+        GROUP BY Event
+        ORDER BY Event
+    """))
+
+
+@_cached_query
+def _100m_variations() -> pd.DataFrame:
+    return _compact(query_data("""
+        SELECT Event, Gender, COUNT(*) as count, MIN(Start_Date) as earliest, MAX(Start_Date) as latest
+        FROM athletics_data
+        WHERE Event LIKE '%100%'
+        GROUP BY Event, Gender
+        ORDER BY Event, Gender
+    """))
+
+
+@_cached_query
+def _top_competitions() -> pd.DataFrame:
+    return _compact(query_data("""
+        SELECT Competition, COUNT(*) as count, MIN(Start_Date) as earliest, MAX(Start_Date) as latest
+        FROM athletics_data
+        GROUP BY Competition
+        ORDER BY count DESC
+        LIMIT 15
+    """))
+
 
 def is_para_athletics_event(event_name):
     """
@@ -21,9 +121,13 @@ def is_para_athletics_event(event_name):
     if not event_name:
         return False
 
-    # Pattern: T or F followed by 2 digits (11-99)
-    para_pattern = r'\b[TF]\d{2}\b'
-    return bool(re.search(para_pattern, str(event_name)))
+    return bool(_PARA_RE.search(event_name if isinstance(event_name, str) else str(event_name)))
+
+def _write_lines(lines):
+    """Write a section's listing lines to stdout in a single write."""
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
 
 def main():
     print("=" * 70)
@@ -41,7 +145,7 @@ def main():
     print("1. TOTAL ROW COUNT")
     print("-" * 70)
 
-    total_df = query_data("SELECT COUNT(*) as total FROM athletics_data")
+    total_df = _total_rows()
     total_rows = int(total_df['total'].iloc[0])
     print(f"Total rows: {total_rows:,}")
 
@@ -49,76 +153,69 @@ def main():
     print("2. SAMPLE EVENTS (First 20 unique events)")
     print("-" * 70)
 
-    events_df = query_data("""
-        SELECT DISTINCT Event
-        FROM athletics_data
-        ORDER BY Event
-    """)
+    # Only the count and the first 20 names come back, not every event
+    event_count = int(_distinct_event_count()['n'].iloc[0])
 
-    print(f"\nTotal unique events: {len(events_df)}")
+    print(f"\nTotal unique events: {event_count}")
     print("\nFirst 20 events:")
-    for idx, event in enumerate(events_df['Event'].head(20), 1):
-        is_para = is_para_athletics_event(event)
+    first_events = _first_events()['Event']
+    first_is_para = first_events.str.contains(_PARA_RE, na=False)
+    lines = []
+    for idx, (event, is_para) in enumerate(zip(first_events, first_is_para), 1):
         marker = "⚠️ PARA" if is_para else "✓ Regular"
-        print(f"  {idx:2d}. {event:40s} [{marker}]")
+        lines.append(f"  {idx:2d}. {event:40s} [{marker}]")
+    _write_lines(lines)
 
     print("\n" + "-" * 70)
     print("3. PARA-ATHLETICS DETECTION")
     print("-" * 70)
 
-    # Get all events and check for para-athletics
-    all_events = query_data("SELECT Event, COUNT(*) as count FROM athletics_data GROUP BY Event")
-    all_events['is_para'] = all_events['Event'].apply(is_para_athletics_event)
-
-    para_events = all_events[all_events['is_para'] == True]
-    regular_events = all_events[all_events['is_para'] == False]
-
-    para_count = para_events['count'].sum()
-    regular_count = regular_events['count'].sum()
+    # Classify para vs regular in the database - only the totals come back
+    split = _para_split().iloc[0]
+    para_count = int(split['para_count'] or 0)
+    regular_count = int(split['regular_count'] or 0)
 
     print(f"\nRegular Athletics:")
-    print(f"  Events: {len(regular_events):,}")
+    print(f"  Events: {int(split['regular_events'] or 0):,}")
     print(f"  Records: {regular_count:,} ({100*regular_count/total_rows:.1f}%)")
 
     print(f"\nPara-Athletics:")
-    print(f"  Events: {len(para_events):,}")
+    print(f"  Events: {int(split['para_events'] or 0):,}")
     print(f"  Records: {para_count:,} ({100*para_count/total_rows:.1f}%)")
 
     if para_count > 0:
         print(f"\n⚠️ WARNING: Database contains {para_count:,} para-athletics records!")
         print("\nSample para-athletics events:")
-        for idx, row in para_events.head(10).iterrows():
-            print(f"  - {row['Event']:40s} ({row['count']:,} records)")
+        para_events = _para_event_sample()
+        _write_lines([
+            f"  - {event:40s} ({count:,} records)"
+            for event, count in para_events[['Event', 'count']].itertuples(index=False, name=None)
+        ])
 
     print("\n" + "-" * 70)
     print("4. 100M DATA CHECK")
     print("-" * 70)
 
     # Check for 100m data (both regular and para)
-    m100_df = query_data("""
-        SELECT Event, Gender, COUNT(*) as count, MIN(Start_Date) as earliest, MAX(Start_Date) as latest
-        FROM athletics_data
-        WHERE Event LIKE '%100%'
-        GROUP BY Event, Gender
-        ORDER BY Event, Gender
-    """)
+    m100_df = _100m_variations()
+
+    m100_is_para = m100_df['Event'].str.contains(_PARA_RE, na=False)
 
     print(f"\nFound {len(m100_df)} 100m event variations:")
-    for idx, row in m100_df.iterrows():
-        is_para = is_para_athletics_event(row['Event'])
+    m100_rows = m100_df[['Event', 'Gender', 'count', 'earliest', 'latest']].itertuples(index=False, name=None)
+    lines = []
+    for (event, gender, count, earliest, latest), is_para in zip(m100_rows, m100_is_para):
         marker = "⚠️ PARA" if is_para else "✓"
-        print(f"  {marker} {row['Event']:40s} {row['Gender']:5s} - {row['count']:,} records ({row['earliest']} to {row['latest']})")
+        lines.append(f"  {marker} {event:40s} {gender:5s} - {count:,} records ({earliest} to {latest})")
+    _write_lines(lines)
 
-    # Check specifically for regular Men's 100m
-    regular_100m = query_data("""
-        SELECT COUNT(*) as count, MIN(Start_Date) as earliest, MAX(Start_Date) as latest
-        FROM athletics_data
-        WHERE Event = '100 Metres' AND Gender = 'Men'
-    """)
+    # Check specifically for regular Men's 100m (a subset of the rows above)
+    regular_mask = (m100_df['Event'] == '100 Metres') & (m100_df['Gender'] == 'Men')
+    regular_100m_count = int(m100_df.loc[regular_mask, 'count'].sum())
 
-    if len(regular_100m) > 0 and regular_100m['count'].iloc[0] > 0:
-        print(f"\n✓ Regular Men's 100m: {regular_100m['count'].iloc[0]:,} records")
-        print(f"  Date range: {regular_100m['earliest'].iloc[0]} to {regular_100m['latest'].iloc[0]}")
+    if regular_100m_count > 0:
+        print(f"\n✓ Regular Men's 100m: {regular_100m_count:,} records")
+        print(f"  Date range: {m100_df.loc[regular_mask, 'earliest'].min()} to {m100_df.loc[regular_mask, 'latest'].max()}")
     else:
         print(f"\n❌ ERROR: No regular Men's 100m data found!")
 
@@ -126,17 +223,14 @@ def main():
     print("5. COMPETITION COVERAGE")
     print("-" * 70)
 
-    comps_df = query_data("""
-        SELECT Competition, COUNT(*) as count, MIN(Start_Date) as earliest, MAX(Start_Date) as latest
-        FROM athletics_data
-        GROUP BY Competition
-        ORDER BY count DESC
-        LIMIT 15
-    """)
+    comps_df = _top_competitions()
 
     print(f"\nTop 15 competitions by record count:")
-    for idx, row in comps_df.iterrows():
-        print(f"  {row['Competition']:50s} - {row['count']:,} records ({row['earliest']} to {row['latest']})")
+    print(comps_df.to_string(
+        index=False,
+        columns=['Competition', 'count', 'earliest', 'latest'],
+        formatters={'count': '{:,}'.format}
+    ))
 
     print("\n" + "=" * 70)
     print("DIAGNOSIS COMPLETE")
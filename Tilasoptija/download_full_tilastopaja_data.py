@@ -5,6 +5,7 @@ Downloads the complete ksaoutput_full.csv file with all historical results
 
 import requests
 import os
+import mmap
 from datetime import datetime
 
 # Tilastopaja full data URL
@@ -84,6 +85,32 @@ def download_full_data():
         print(f"\n✗ Unexpected error: {e}")
         return None
 
+def count_lines(file_path, chunk_size=1 << 24):
+    """Count newline-terminated lines by scanning raw bytes (no decoding)."""
+    line_count = 0
+    last_byte = b'\n'
+
+    with open(file_path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for start in range(0, len(mm), chunk_size):
+                    line_count += mm[start:start + chunk_size].count(b'\n')
+                if len(mm):
+                    last_byte = mm[-1:]
+        except (ValueError, OSError):
+            # Empty file or mmap unavailable - fall back to chunked reads
+            f.seek(0)
+            line_count = 0
+            while chunk := f.read(chunk_size):
+                line_count += chunk.count(b'\n')
+                last_byte = chunk[-1:]
+
+    # A final line without a trailing newline still counts
+    if last_byte != b'\n':
+        line_count += 1
+
+    return line_count
+
 def verify_csv_format(file_path):
     """Quick verification of CSV format and row count."""
 
@@ -104,8 +131,7 @@ def verify_csv_format(file_path):
         # Count total lines (approximate row count)
         print(f"\n⏳ Counting rows (this may take a minute)...")
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            row_count = sum(1 for _ in f) - 1  # Subtract header
+        row_count = count_lines(file_path) - 1  # Subtract header
 
         print(f"✓ Total rows: {row_count:,}")
 
@@ -14,10 +14,11 @@ Used by Coach View for setting realistic performance targets.
 """
 
 import sqlite3
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-import statistics
+from functools import lru_cache
 
 
 # Championship competition IDs for benchmark calculations
@@ -37,24 +38,34 @@ ROUND_MAPPINGS = {
 }
 
 
+# Flat lowercase variant -> standard round lookup, built once at import
+_ROUND_LOOKUP = {
+    variant.lower(): standard
+    for standard, variants in ROUND_MAPPINGS.items()
+    for variant in variants
+}
+
+
 def normalize_round(round_name: str) -> str:
     """Normalize round name to standard format."""
     if not round_name:
         return 'unknown'
 
-    round_lower = str(round_name).lower().strip()
+    return _ROUND_LOOKUP.get(str(round_name).strip().lower(), 'unknown')
 
-    for standard, variants in ROUND_MAPPINGS.items():
-        if round_name in variants or round_lower in [v.lower() for v in variants]:
-            return standard
 
-    return 'unknown'
+def normalize_rounds(rounds: pd.Series) -> pd.Series:
+    """Vectorized normalize_round for a whole Round column."""
+    return rounds.astype(str).str.strip().str.lower().map(_ROUND_LOOKUP).fillna('unknown')
 
 
+@lru_cache(maxsize=512)
 def get_event_type(event_name: str) -> str:
     """
     Determine if event is time-based, distance-based, or points-based.
 
+    Memoized - called per event (and per athlete/event group) on every render.
+
     Returns:
         'time' - lower is better (track events)
         'distance' - higher is better (jumps, throws)
@@ -75,6 +86,30 @@ def get_event_type(event_name: str) -> str:
     return 'time'
 
 
+# Finishing placings counted as medals
+_MEDAL_PLACINGS = (1, 2, 3)
+
+ROUND_DESCRIPTIONS = {
+    'medal': 'Top 3 finishers in finals (last 3-5 championships)',
+    'final': 'All finalists (top 8) - average performance',
+    'semi': 'Semi-final qualifiers - typical advancing performance',
+    'heat': 'Heat qualifiers - minimum performance to advance',
+}
+
+
+def _qualifier_count(round_name: str, n: int) -> int:
+    """
+    Number of a round's n results (ranked best first) treated as advancing.
+
+    Semis: all but the bottom 40% (top 60% typically advance).
+    Heats: the best half (top 3 + fastest losers). Always at least one.
+    Mirrored in SQL by _QUALIFIER_COUNT_SQL.
+    """
+    if round_name == 'semi':
+        return max(1, n - int(n * 0.4))
+    return max(1, int(n * 0.5))
+
+
 def calculate_round_benchmarks(
     df: pd.DataFrame,
     event: str,
@@ -100,6 +135,7 @@ def calculate_round_benchmarks(
         }
     """
     event_type = get_event_type(event)
+    ascending = event_type == 'time'
 
     # Filter data
     filtered = df[
@@ -110,79 +146,68 @@ def calculate_round_benchmarks(
     if championships:
         filtered = filtered[filtered['Competition_ID'].astype(str).isin(championships)]
 
+    filtered = filtered.dropna(subset=['Result_numeric'])
     if filtered.empty:
         return get_default_benchmarks(event, gender)
 
     # Normalize round names
-    filtered['Round_Normalized'] = filtered['Round'].apply(normalize_round)
+    filtered['Round_Normalized'] = normalize_rounds(filtered['Round'])
+
+    # One grouped pass gives mean/min/max/editions for every round
+    grp = filtered.groupby('Round_Normalized')['Result_numeric']
+    stats = grp.agg(['mean', 'min', 'max', 'count'])
+    editions = filtered.groupby('Round_Normalized')['Competition_ID'].nunique()
 
     benchmarks = {}
 
     # Medal line: Top 3 finishers in finals
-    finals = filtered[filtered['Round_Normalized'] == 'final'].copy()
+    finals = filtered[filtered['Round_Normalized'] == 'final']
     if not finals.empty:
-        finals['Position'] = pd.to_numeric(finals['Position'], errors='coerce')
-        medalists = finals[finals['Position'] <= 3]
+        position = finals['Position']
+        if not pd.api.types.is_numeric_dtype(position):
+            position = pd.to_numeric(position, errors='coerce')
+        medalists = finals[position.isin(_MEDAL_PLACINGS)]
 
         if not medalists.empty:
-            medal_perfs = medalists['Result_numeric'].dropna().tolist()
-            if medal_perfs:
-                benchmarks['medal'] = {
-                    'average': round(statistics.mean(medal_perfs), 2),
-                    'range': (round(min(medal_perfs), 2), round(max(medal_perfs), 2)),
-                    'best': round(min(medal_perfs) if event_type == 'time' else max(medal_perfs), 2),
-                    'editions': len(set(medalists['Competition_ID'].tolist())),
-                    'description': 'Top 3 finishers in finals (last 3-5 championships)'
-                }
-
-    # Final line: All finalists (typically top 8)
-    if not finals.empty:
-        final_perfs = finals['Result_numeric'].dropna().tolist()
-        if final_perfs:
-            benchmarks['final'] = {
-                'average': round(statistics.mean(final_perfs), 2),
-                'range': (round(min(final_perfs), 2), round(max(final_perfs), 2)),
-                'cutoff': round(max(final_perfs) if event_type == 'time' else min(final_perfs), 2),
-                'editions': len(set(finals['Competition_ID'].tolist())),
-                'description': 'All finalists (top 8) - average performance'
+            medal_perfs = medalists['Result_numeric']
+            benchmarks['medal'] = {
+                'average': round(medal_perfs.mean(), 2),
+                'range': (round(medal_perfs.min(), 2), round(medal_perfs.max(), 2)),
+                'best': round(medal_perfs.min() if ascending else medal_perfs.max(), 2),
+                'editions': medalists['Competition_ID'].nunique(),
+                'description': ROUND_DESCRIPTIONS['medal']
             }
 
-    # Semi-final line: Qualifiers from semis
-    semis = filtered[filtered['Round_Normalized'] == 'semi'].copy()
-    if not semis.empty:
-        # Get qualifiers (typically positions that advanced, or use time-based qualifier marks)
-        semi_perfs = semis['Result_numeric'].dropna().tolist()
-        if semi_perfs:
-            # Estimate qualifying mark (top 60% typically advance)
-            semi_perfs_sorted = sorted(semi_perfs, reverse=(event_type != 'time'))
-            cutoff_idx = int(len(semi_perfs_sorted) * 0.4)  # Bottom 40% don't advance
-            qualifying_perfs = semi_perfs_sorted[:max(1, len(semi_perfs_sorted) - cutoff_idx)]
-
-            benchmarks['semi'] = {
-                'average': round(statistics.mean(qualifying_perfs), 2),
-                'range': (round(min(semi_perfs), 2), round(max(semi_perfs), 2)),
-                'cutoff': round(qualifying_perfs[-1] if qualifying_perfs else semi_perfs_sorted[-1], 2),
-                'editions': len(set(semis['Competition_ID'].tolist())),
-                'description': 'Semi-final qualifiers - typical advancing performance'
-            }
+    # Final line: All finalists (typically top 8)
+    if 'final' in stats.index:
+        final_stats = stats.loc['final']
+        benchmarks['final'] = {
+            'average': round(final_stats['mean'], 2),
+            'range': (round(final_stats['min'], 2), round(final_stats['max'], 2)),
+            'cutoff': round(final_stats['max'] if ascending else final_stats['min'], 2),
+            'editions': int(editions['final']),
+            'description': ROUND_DESCRIPTIONS['final']
+        }
 
-    # Heat survival line: Slowest/lowest heat qualifiers
-    heats = filtered[filtered['Round_Normalized'] == 'heat'].copy()
-    if not heats.empty:
-        heat_perfs = heats['Result_numeric'].dropna().tolist()
-        if heat_perfs:
-            # Estimate heat qualifying (typically top 3 + fastest losers)
-            heat_perfs_sorted = sorted(heat_perfs, reverse=(event_type != 'time'))
-            cutoff_idx = int(len(heat_perfs_sorted) * 0.5)  # ~50% advance from heats
-            qualifying_perfs = heat_perfs_sorted[:max(1, cutoff_idx)]
-
-            benchmarks['heat'] = {
-                'average': round(statistics.mean(qualifying_perfs), 2),
-                'range': (round(min(heat_perfs), 2), round(max(heat_perfs), 2)),
-                'cutoff': round(qualifying_perfs[-1] if qualifying_perfs else heat_perfs_sorted[cutoff_idx], 2),
-                'editions': len(set(heats['Competition_ID'].tolist())),
-                'description': 'Heat qualifiers - minimum performance to advance'
-            }
+    # Semi-final and heat lines: the advancing share of each round, ranked
+    # best first; the cutoff is the last qualifier
+    for round_name in ('semi', 'heat'):
+        if round_name not in stats.index:
+            continue
+        perfs = np.sort(filtered.loc[filtered['Round_Normalized'] == round_name, 'Result_numeric']
+                        .to_numpy(dtype=np.float64))
+        if not ascending:
+            perfs = perfs[::-1]
+        qualifying = perfs[:_qualifier_count(round_name, len(perfs))]
+        round_stats = stats.loc[round_name]
+
+        benchmarks[round_name] = {
+            'average': round(qualifying.mean(), 2),
+            'range': (round(round_stats['min'], 2), round(round_stats['max'], 2)),
+            'cutoff': round(qualifying[-1], 2),
+            'editions': int(editions[round_name]),
+            'description': ROUND_DESCRIPTIONS[round_name]
+        }
 
     # Fill in missing benchmarks with defaults
     default_benchmarks = get_default_benchmarks(event, gender)
@@ -262,6 +287,101 @@ def get_default_benchmarks(event: str, gender: str) -> Dict[str, Dict]:
     return result
 
 
+def _round_case_sql(column: str = 'Round') -> str:
+    """SQL CASE expression mapping raw round names onto ROUND_MAPPINGS keys."""
+    whens = []
+    for standard, variants in ROUND_MAPPINGS.items():
+        names = ', '.join(sorted({f"'{v.lower()}'" for v in variants}))
+        whens.append(f"WHEN lower(trim({column})) IN ({names}) THEN '{standard}'")
+    return f"CASE {' '.join(whens)} ELSE 'unknown' END"
+
+
+# SQL form of _qualifier_count over a ranked round of n results
+_QUALIFIER_COUNT_SQL = (
+    "CASE WHEN rnd = 'semi' THEN MAX(1, n - CAST(n * 0.4 AS INTEGER)) "
+    "ELSE MAX(1, CAST(n * 0.5 AS INTEGER)) END"
+)
+
+# SQL test for a medal placing; Position may be stored as text, so only
+# plain numbers count (as pd.to_numeric does in calculate_round_benchmarks)
+_MEDAL_PLACING_SQL = (
+    f"CAST(trim(Position) AS REAL) IN ({', '.join(map(str, _MEDAL_PLACINGS))}) "
+    "AND trim(Position) <> '' AND trim(Position) NOT GLOB '*[^0-9.]*'"
+)
+
+# Per-round aggregates computed inside SQLite, by the same rules as
+# calculate_round_benchmarks: medalists by placing, semi/heat qualifiers by
+# rank within the round.
+ROUND_BENCHMARK_SQL = """
+    WITH r AS (
+        SELECT {round_case} AS rnd, Position, Result_numeric, Competition_ID
+        FROM results
+        WHERE Event = ?
+        AND Gender = ?
+        AND Competition_ID IN ({placeholders})
+        AND Result_numeric IS NOT NULL
+    ),
+    finals AS (
+        SELECT Position, Result_numeric, Competition_ID
+        FROM r
+        WHERE rnd = 'final'
+    ),
+    medalists AS (
+        SELECT Result_numeric, Competition_ID
+        FROM finals
+        WHERE {medal_placing}
+    ),
+    ranked AS (
+        SELECT rnd, Result_numeric, Competition_ID,
+               ROW_NUMBER() OVER (PARTITION BY rnd ORDER BY Result_numeric {order}) AS rn,
+               COUNT(*) OVER (PARTITION BY rnd) AS n
+        FROM r
+        WHERE rnd IN ('semi', 'heat')
+    ),
+    qualified AS (
+        SELECT rnd, Result_numeric, Competition_ID, rn, {qualifier_count} AS last_rn
+        FROM ranked
+    )
+    SELECT 'medal' AS rnd, AVG(Result_numeric) AS average, MIN(Result_numeric) AS low,
+           MAX(Result_numeric) AS high, {best}(Result_numeric) AS mark,
+           COUNT(DISTINCT Competition_ID) AS editions
+    FROM medalists
+    UNION ALL
+    SELECT 'final', AVG(Result_numeric), MIN(Result_numeric), MAX(Result_numeric),
+           {worst}(Result_numeric), COUNT(DISTINCT Competition_ID)
+    FROM finals
+    UNION ALL
+    SELECT rnd, AVG(CASE WHEN rn <= last_rn THEN Result_numeric END),
+           MIN(Result_numeric), MAX(Result_numeric),
+           MAX(CASE WHEN rn = last_rn THEN Result_numeric END),
+           COUNT(DISTINCT Competition_ID)
+    FROM qualified
+    GROUP BY rnd
+"""
+
+# Index serving ROUND_BENCHMARK_SQL's filter; created by the database build
+# step (create_benchmark_index), never on the read path
+BENCHMARK_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_results_ev_gender_comp "
+    "ON results(Event, Gender, Competition_ID, Round)"
+)
+
+
+def create_benchmark_index(db_path: str) -> None:
+    """
+    Create the index load_benchmarks_from_db relies on.
+
+    Run once when building or migrating the results database, e.g.
+    `python historical_benchmarks.py --create-index path/to/results.db`.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute(BENCHMARK_INDEX_SQL)
+        conn.commit()
+    finally:
+        conn.close()
+
+
 def load_benchmarks_from_db(
     db_path: str,
     event: str,
@@ -271,6 +391,11 @@ def load_benchmarks_from_db(
     """
     Load and calculate benchmarks from SQLite database.
 
+    Aggregates per round inside SQLite so only one row per round comes back
+    instead of every championship result for the event. Gives the same
+    benchmarks as calculate_round_benchmarks on the same rows; build the
+    supporting index with create_benchmark_index.
+
     Args:
         db_path: Path to SQLite database
         event: Event name
@@ -290,25 +415,43 @@ def load_benchmarks_from_db(
             conn.close()
             return get_default_benchmarks(event, gender)
 
-        # Build query
+        is_time = get_event_type(event) == 'time'
         placeholders = ','.join(['?' for _ in championship_ids])
-        query = f"""
-            SELECT Event, Gender, Round, Position, Result_numeric, Competition_ID
-            FROM results
-            WHERE Event = ?
-            AND Gender = ?
-            AND Competition_ID IN ({placeholders})
-            AND Result_numeric IS NOT NULL
-        """
+        query = ROUND_BENCHMARK_SQL.format(
+            round_case=_round_case_sql(),
+            placeholders=placeholders,
+            medal_placing=_MEDAL_PLACING_SQL,
+            qualifier_count=_QUALIFIER_COUNT_SQL,
+            order='ASC' if is_time else 'DESC',
+            best='MIN' if is_time else 'MAX',
+            worst='MAX' if is_time else 'MIN',
+        )
 
         params = [event, gender] + championship_ids
-        df = pd.read_sql_query(query, conn, params=params)
+        rows = conn.execute(query, params).fetchall()
         conn.close()
 
-        if df.empty:
+        benchmarks = {}
+        for rnd, average, low, high, mark, editions in rows:
+            if not editions:
+                continue
+            benchmarks[rnd] = {
+                'average': round(average, 2),
+                'range': (round(low, 2), round(high, 2)),
+                'best' if rnd == 'medal' else 'cutoff': round(mark, 2),
+                'editions': editions,
+                'description': ROUND_DESCRIPTIONS[rnd]
+            }
+
+        if not benchmarks:
             return get_default_benchmarks(event, gender)
 
-        return calculate_round_benchmarks(df, event, gender, championship_ids)
+        default_benchmarks = get_default_benchmarks(event, gender)
+        for round_name in ['medal', 'final', 'semi', 'heat']:
+            if round_name not in benchmarks:
+                benchmarks[round_name] = default_benchmarks.get(round_name, {})
+
+        return benchmarks
 
     except Exception as e:
         print(f"Error loading benchmarks: {e}")
@@ -382,6 +525,42 @@ def format_benchmark_for_display(value: float, event_type: str = 'time') -> str:
         return f"{value:.2f}m"
 
 
+def format_benchmarks_for_display(values, event_type: str = 'time') -> np.ndarray:
+    """
+    Vectorized format_benchmark_for_display over an array of values.
+
+    Args:
+        values: Array-like of floats (NaN/None -> 'N/A')
+        event_type: 'time', 'distance', or 'points'
+
+    Returns:
+        Object array of display strings, same length as values
+    """
+    vals = np.asarray(values, dtype=np.float64)
+    out = np.full(vals.shape, 'N/A', dtype=object)
+    present = ~np.isnan(vals)
+    v = vals[present]
+    if not v.size:
+        return out
+
+    if event_type == 'time':
+        secs = np.char.mod('%05.2f', v % 60)
+        hms = np.char.add(
+            np.char.add(np.char.mod('%d:', (v // 3600).astype(np.int64)),
+                        np.char.mod('%02d:', ((v % 3600) // 60).astype(np.int64))),
+            secs
+        )
+        ms = np.char.add(np.char.mod('%d:', (v // 60).astype(np.int64)), secs)
+        formatted = np.where(v >= 3600, hms, np.where(v >= 60, ms, np.char.mod('%.2f', v)))
+    elif event_type == 'points':
+        formatted = np.char.mod('%d', v.astype(np.int64))
+    else:
+        formatted = np.char.add(np.char.mod('%.2f', v), 'm')
+
+    out[present] = formatted
+    return out
+
+
 # Methodology documentation
 BENCHMARK_METHODOLOGY = """
 ## Championship Benchmark Methodology
@@ -414,3 +593,18 @@ Based on historical heat qualifying times/marks.
 - Tactical racing can produce slower winning times
 - Field events may have different qualifying standards each year
 """
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Historical benchmark database utilities')
+    parser.add_argument('--create-index', metavar='DB_PATH',
+                        help='create the benchmark lookup index in a SQLite results database')
+    args = parser.parse_args()
+
+    if args.create_index:
+        create_benchmark_index(args.create_index)
+        print(f"Created idx_results_ev_gender_comp in {args.create_index}")
+    else:
+        parser.print_help()
@@ -21,6 +21,13 @@ except ImportError:
     print("ERROR: pyodbc not installed. Run: pip install pyodbc")
     sys.exit(1)
 
+# Optional: bcpandas drives the SQL Server bcp utility (bulk copy protocol)
+try:
+    from bcpandas import SqlCreds, to_sql as bcp_to_sql
+    BCPANDAS_AVAILABLE = True
+except ImportError:
+    BCPANDAS_AVAILABLE = False
+
 def get_azure_connection():
     """Get Azure SQL connection (same as azure_sync.py)."""
     if not AZURE_SQL_CONN:
@@ -47,7 +54,107 @@ def get_azure_connection():
 
     raise ValueError(f"No compatible ODBC driver found. Available: {available_drivers}")
 
-def main():
+def get_bcp_creds():
+    """
+    Build bcpandas credentials from the AZURE_SQL_CONN ODBC string.
+
+    bcp reads its data from the client, so this works against Azure SQL
+    Database, where BULK INSERT cannot read a local file.
+    """
+    if not AZURE_SQL_CONN:
+        raise ValueError("AZURE_SQL_CONN environment variable not set!")
+
+    parts = {}
+    for item in AZURE_SQL_CONN.split(';'):
+        if '=' in item:
+            key, value = item.split('=', 1)
+            parts[key.strip().lower()] = value.strip()
+
+    server = parts.get('server', '')
+    if server.lower().startswith('tcp:'):
+        server = server[4:]
+    host, _, port = server.partition(',')
+
+    return SqlCreds(
+        host,
+        parts.get('database'),
+        username=parts.get('uid'),
+        password=parts.get('pwd'),
+        port=int(port) if port else 1433,
+    )
+
+def insert_batch(azure_conn, azure_cursor, insert_sql, rows):
+    """
+    Insert a batch of row tuples with one executemany call and commit.
+
+    If the batch insert fails, roll it back and insert row by row instead,
+    so a single bad row is skipped rather than aborting the migration.
+    """
+    try:
+        azure_cursor.executemany(insert_sql, rows)
+        azure_conn.commit()
+        return
+    except Exception as e:
+        azure_conn.rollback()
+        print(f"   Batch insert failed ({e}), retrying row by row...")
+
+    for values in rows:
+        try:
+            azure_cursor.execute(insert_sql, values)
+        except Exception as e:
+            print(f"   Error inserting row: {e}")
+            continue
+    azure_conn.commit()
+
+def snapshot_indexes(azure_cursor, table_name='athletics_data'):
+    """
+    Describe the table's secondary (nonclustered, non-constraint) indexes.
+
+    Returns:
+        List of (name, is_unique, key_columns, include_columns, filter_definition)
+        tuples, where key_columns is a list of (column, is_descending).
+    """
+    azure_cursor.execute("""
+        SELECT i.name, i.is_unique, i.filter_definition,
+               c.name, ic.is_included_column, ic.is_descending_key
+        FROM sys.indexes i
+        JOIN sys.index_columns ic ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+        JOIN sys.columns c ON c.object_id = ic.object_id AND c.column_id = ic.column_id
+        WHERE i.object_id = OBJECT_ID(?)
+          AND i.type = 2
+          AND i.is_primary_key = 0
+          AND i.is_unique_constraint = 0
+        ORDER BY i.name, ic.is_included_column, ic.key_ordinal, ic.index_column_id
+    """, table_name)
+
+    indexes = {}
+    for name, is_unique, filter_definition, column, is_included, is_descending in azure_cursor.fetchall():
+        index = indexes.setdefault(name, (name, bool(is_unique), [], [], filter_definition))
+        if is_included:
+            index[3].append(column)
+        else:
+            index[2].append((column, bool(is_descending)))
+    return list(indexes.values())
+
+def create_index_sql(index, table_name='athletics_data'):
+    """CREATE INDEX statement that recreates a snapshot_indexes() entry."""
+    name, is_unique, key_columns, include_columns, filter_definition = index
+    keys = ', '.join(f"[{col}] {'DESC' if desc else 'ASC'}" for col, desc in key_columns)
+    sql = f"CREATE {'UNIQUE ' if is_unique else ''}NONCLUSTERED INDEX [{name}] ON {table_name} ({keys})"
+    if include_columns:
+        sql += f" INCLUDE ({', '.join(f'[{col}]' for col in include_columns)})"
+    if filter_definition:
+        sql += f" WHERE {filter_definition}"
+    return sql
+
+def main(use_bcp=False):
+    """
+    Replace athletics_data in Azure SQL with the local SQLite table.
+
+    Args:
+        use_bcp: Load through the bcp bulk copy utility (via bcpandas)
+            instead of parameterized executemany INSERTs
+    """
     print("=" * 70)
     print("MIGRATE SQLITE TO AZURE SQL")
     print("=" * 70)
@@ -74,6 +181,7 @@ def main():
     print("\n[2/5] Connecting to Azure SQL...")
     try:
         azure_conn = get_azure_connection()
+        azure_conn.autocommit = False
         azure_cursor = azure_conn.cursor()
         print("   OK: Connected to Azure SQL")
 
@@ -90,50 +198,101 @@ def main():
     print(f"   and replace with {sqlite_count:,} rows from local SQLite")
     print("   Proceeding automatically...")
 
-    # Step 4: Delete existing Azure data
-    print("\n[4/5] Deleting existing Azure SQL data...")
-    azure_cursor.execute("DELETE FROM athletics_data")
+    # Secondary indexes are dropped for the bulk load and rebuilt once at
+    # the end, instead of being maintained row by row during the inserts
+    indexes = snapshot_indexes(azure_cursor)
+    for name, *_ in indexes:
+        azure_cursor.execute(f"DROP INDEX [{name}] ON athletics_data")
     azure_conn.commit()
-    print(f"   OK: Deleted {azure_count_before:,} rows")
-
-    # Step 5: Migrate in batches
-    print("\n[5/5] Migrating data...")
-
-    BATCH_SIZE = 1000
-    offset = 0
-    total_migrated = 0
-
-    while True:
-        # Read batch from SQLite
-        batch_df = pd.read_sql(
-            f"SELECT * FROM athletics_data LIMIT {BATCH_SIZE} OFFSET {offset}",
-            sqlite_conn
-        )
-
-        if batch_df.empty:
-            break
-
-        # Insert into Azure SQL
-        for _, row in batch_df.iterrows():
-            placeholders = ', '.join(['?' for _ in columns])
-            col_names = ', '.join(columns)
-            values = [row[col] for col in columns]
-
-            try:
-                azure_cursor.execute(
-                    f"INSERT INTO athletics_data ({col_names}) VALUES ({placeholders})",
-                    values
-                )
-            except Exception as e:
-                print(f"   Error inserting row: {e}")
-                continue
-
-        azure_conn.commit()
-        total_migrated += len(batch_df)
-        offset += BATCH_SIZE
+    if indexes:
+        print(f"   Dropped {len(indexes)} secondary index(es) for the load")
 
-        pct = 100 * total_migrated / sqlite_count
-        print(f"   Progress: {total_migrated:,} / {sqlite_count:,} ({pct:.1f}%)")
+    try:
+        # Step 4: Delete existing Azure data
+        print("\n[4/5] Deleting existing Azure SQL data...")
+        try:
+            # Deallocates pages instead of logging every deleted row
+            azure_cursor.execute("TRUNCATE TABLE athletics_data")
+            azure_conn.commit()
+        except pyodbc.Error as e:
+            # TRUNCATE is refused when foreign keys reference the table
+            azure_conn.rollback()
+            print(f"   TRUNCATE not allowed ({e}), deleting in chunks...")
+            while True:
+                azure_cursor.execute("DELETE TOP (100000) FROM athletics_data")
+                deleted = azure_cursor.rowcount
+                azure_conn.commit()
+                if deleted <= 0:
+                    break
+        print(f"   OK: Deleted {azure_count_before:,} rows")
+
+        # Step 5: Migrate in batches
+        print("\n[5/5] Migrating data...")
+
+        BATCH_SIZE = 10000
+        # bcp has a fixed cost per run (temp CSV, format file, metadata
+        # round-trip), so it gets far larger chunks than executemany
+        BCP_CHUNK_SIZE = 500000
+        total_migrated = 0
+
+        # One parameterized INSERT for the whole run; fast_executemany sends
+        # each batch's parameters to Azure SQL in a single round-trip
+        placeholders = ', '.join(['?' for _ in columns])
+        col_names = ', '.join(columns)
+        insert_sql = f"INSERT INTO athletics_data ({col_names}) VALUES ({placeholders})"
+        azure_cursor.fast_executemany = True
+        azure_cursor.execute("SET NOCOUNT ON")
+
+        bcp_creds = None
+        if use_bcp:
+            if BCPANDAS_AVAILABLE:
+                bcp_creds = get_bcp_creds()
+                print(f"   Using bcp bulk copy ({BCP_CHUNK_SIZE:,} rows per run)")
+            else:
+                print("   bcpandas not installed (pip install bcpandas) - using executemany")
+        fetch_size = BCP_CHUNK_SIZE if bcp_creds is not None else BATCH_SIZE
+
+        # Stream the SQLite table in one pass (LIMIT/OFFSET paging rescans
+        # every earlier row on each batch)
+        read_cursor = sqlite_conn.cursor()
+        read_cursor.execute(f"SELECT {col_names} FROM athletics_data")
+
+        while True:
+            # Read batch from SQLite
+            rows = read_cursor.fetchmany(fetch_size)
+
+            if not rows:
+                break
+
+            # Insert into Azure SQL
+            if bcp_creds is not None:
+                try:
+                    # One bcp batch (one transaction) per chunk: a failed run
+                    # commits none of its rows, so the chunk can be re-sent
+                    # with executemany without duplicating any of them
+                    bcp_to_sql(
+                        pd.DataFrame.from_records(rows, columns=columns),
+                        'athletics_data', bcp_creds,
+                        index=False, if_exists='append', batch_size=len(rows)
+                    )
+                except Exception as e:
+                    print(f"   bcp failed ({e}), inserting chunk with executemany...")
+                    for start in range(0, len(rows), BATCH_SIZE):
+                        insert_batch(azure_conn, azure_cursor, insert_sql, rows[start:start + BATCH_SIZE])
+            else:
+                insert_batch(azure_conn, azure_cursor, insert_sql, rows)
+            total_migrated += len(rows)
+
+            pct = 100 * total_migrated / sqlite_count
+            print(f"   Progress: {total_migrated:,} / {sqlite_count:,} ({pct:.1f}%)")
+    finally:
+        # Rebuild the secondary indexes over the loaded data (also if the
+        # load was interrupted, so the table is never left without them)
+        azure_conn.rollback()
+        for index in indexes:
+            azure_cursor.execute(create_index_sql(index))
+            azure_conn.commit()
+            print(f"   Rebuilt index {index[0]}")
 
     # Final verification
     print("\n" + "=" * 70)
@@ -155,4 +314,11 @@ def main():
     azure_conn.close()
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Migrate SQLite to Azure SQL')
+    parser.add_argument('--bcp', action='store_true',
+                        help='Bulk load with the bcp utility (requires bcpandas)')
+
+    args = parser.parse_args()
+    main(use_bcp=args.bcp)
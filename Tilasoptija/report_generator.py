@@ -161,6 +161,44 @@ class AthleteReportGenerator:
         if not REPORTLAB_AVAILABLE:
             raise ImportError("reportlab is required for PDF generation")
 
+        return self._build_pdf(self._athlete_story(
+            athlete_data, performances, benchmarks, probabilities, competitors, chart_images
+        ))
+
+    def generate_athlete_reports_batch(self, reports: List[Dict]) -> bytes:
+        """
+        Generate several athlete report cards as one PDF.
+
+        All reports are laid out in a single document build (one page
+        template, one style sheet), each starting on a new page.
+
+        Args:
+            reports: List of dicts with the generate_athlete_report arguments
+                ('athlete_data', 'performances', 'benchmarks', 'probabilities',
+                and optionally 'competitors' and 'chart_images')
+
+        Returns:
+            PDF content as bytes
+        """
+        if not REPORTLAB_AVAILABLE:
+            raise ImportError("reportlab is required for PDF generation")
+
+        story = []
+        for report in reports:
+            if story:
+                story.append(PageBreak())
+            story.extend(self._athlete_story(
+                report['athlete_data'],
+                report.get('performances', []),
+                report.get('benchmarks', {}),
+                report.get('probabilities', {}),
+                report.get('competitors'),
+                report.get('chart_images')
+            ))
+        return self._build_pdf(story)
+
+    def _build_pdf(self, story: List) -> bytes:
+        """Lay out a story on the A4 report template and return the PDF bytes."""
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(
             buffer,
@@ -170,7 +208,19 @@ class AthleteReportGenerator:
             topMargin=2*cm,
             bottomMargin=2*cm
         )
+        doc.build(story)
+        return buffer.getvalue()
 
+    def _athlete_story(
+        self,
+        athlete_data: Dict,
+        performances: List[Dict],
+        benchmarks: Dict,
+        probabilities: Dict,
+        competitors: List[Dict] = None,
+        chart_images: Dict[str, bytes] = None
+    ) -> List:
+        """Build the flowables for one athlete report card."""
         story = []
 
         # Title
@@ -232,8 +282,7 @@ class AthleteReportGenerator:
             self.styles['Caption']
         ))
 
-        doc.build(story)
-        return buffer.getvalue()
+        return story
 
     def _create_athlete_header(self, athlete_data: Dict) -> Table:
         """Create the athlete header section."""
@@ -661,6 +710,30 @@ def export_chart_as_png(chart: 'alt.Chart', width: int = 600, height: int = 400)
         return None
 
 
+# Static stylesheet for generate_html_report - built once, not re-formatted per report
+_HTML_REPORT_STYLE = """        <style>
+            body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
+            .container { max-width: 800px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+            h1 { color: #1a5f7a; text-align: center; border-bottom: 3px solid #57c5b6; padding-bottom: 15px; }
+            h2 { color: #343a40; border-left: 4px solid #57c5b6; padding-left: 10px; margin-top: 30px; }
+            .header-info { text-align: center; color: #666; margin-bottom: 20px; }
+            .metrics { display: flex; justify-content: center; gap: 40px; margin: 20px 0; }
+            .metric { text-align: center; padding: 15px 25px; background: #f8f9fa; border-radius: 8px; }
+            .metric-value { font-size: 24px; font-weight: bold; color: #1a5f7a; }
+            .metric-label { font-size: 12px; color: #666; }
+            table { width: 100%; border-collapse: collapse; margin: 15px 0; }
+            th { background: #1a5f7a; color: white; padding: 12px; text-align: center; }
+            td { padding: 10px; text-align: center; border-bottom: 1px solid #ddd; }
+            tr:nth-child(even) { background: #f8f9fa; }
+            .trend-improving { color: #28a745; }
+            .trend-declining { color: #dc3545; }
+            .trend-stable { color: #6c757d; }
+            .methodology { background: #f8f9fa; padding: 15px; border-radius: 5px; font-size: 12px; color: #666; margin-top: 30px; }
+            .footer { text-align: center; color: #999; font-size: 11px; margin-top: 20px; }
+        </style>
+"""
+
+
 def generate_html_report(
     athlete_data: Dict,
     performances: List[Dict],
@@ -681,6 +754,29 @@ def generate_html_report(
     Returns:
         HTML string
     """
+    return "".join(html_report_parts(athlete_data, performances, benchmarks, probabilities, competitors))
+
+
+def html_report_parts(
+    athlete_data: Dict,
+    performances: List[Dict],
+    benchmarks: Dict,
+    probabilities: Dict,
+    competitors: List[Dict] = None
+) -> List[str]:
+    """
+    Build an HTML report as a list of chunks (concatenate for the page).
+
+    Args:
+        athlete_data: Dict with athlete info
+        performances: List of recent performance dicts
+        benchmarks: Dict with championship benchmarks
+        probabilities: Dict with advancement probabilities
+        competitors: Optional list of competitor dicts
+
+    Returns:
+        List of HTML string chunks
+    """
     name = athlete_data.get('name', 'Unknown')
     event = athlete_data.get('event', '-')
     country = athlete_data.get('country', 'KSA')
@@ -689,33 +785,13 @@ def generate_html_report(
     projected = athlete_data.get('projected', '-')
     trend = athlete_data.get('trend', 'stable')
 
-    html = f"""
+    parts = [f"""
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="UTF-8">
         <title>Athlete Report - {name}</title>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }}
-            .container {{ max-width: 800px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-            h1 {{ color: #1a5f7a; text-align: center; border-bottom: 3px solid #57c5b6; padding-bottom: 15px; }}
-            h2 {{ color: #343a40; border-left: 4px solid #57c5b6; padding-left: 10px; margin-top: 30px; }}
-            .header-info {{ text-align: center; color: #666; margin-bottom: 20px; }}
-            .metrics {{ display: flex; justify-content: center; gap: 40px; margin: 20px 0; }}
-            .metric {{ text-align: center; padding: 15px 25px; background: #f8f9fa; border-radius: 8px; }}
-            .metric-value {{ font-size: 24px; font-weight: bold; color: #1a5f7a; }}
-            .metric-label {{ font-size: 12px; color: #666; }}
-            table {{ width: 100%; border-collapse: collapse; margin: 15px 0; }}
-            th {{ background: #1a5f7a; color: white; padding: 12px; text-align: center; }}
-            td {{ padding: 10px; text-align: center; border-bottom: 1px solid #ddd; }}
-            tr:nth-child(even) {{ background: #f8f9fa; }}
-            .trend-improving {{ color: #28a745; }}
-            .trend-declining {{ color: #dc3545; }}
-            .trend-stable {{ color: #6c757d; }}
-            .methodology {{ background: #f8f9fa; padding: 15px; border-radius: 5px; font-size: 12px; color: #666; margin-top: 30px; }}
-            .footer {{ text-align: center; color: #999; font-size: 11px; margin-top: 20px; }}
-        </style>
-    </head>
+""", _HTML_REPORT_STYLE, f"""    </head>
     <body>
         <div class="container">
             <h1>Athlete Report Card</h1>
@@ -750,7 +826,7 @@ def generate_html_report(
                     <th>Benchmark</th>
                     <th>Gap to Projected</th>
                 </tr>
-    """
+    """]
 
     round_labels = {'medal': 'Medal', 'final': 'Final', 'semi': 'Semi-Final', 'heat': 'Heat'}
     for rnd in ['medal', 'final', 'semi', 'heat']:
@@ -763,15 +839,15 @@ def generate_html_report(
                     gap = f"{gap_val:+.2f}"
                 except:
                     pass
-            html += f"""
+            parts.append(f"""
                 <tr>
                     <td>{round_labels.get(rnd, rnd)}</td>
                     <td>{value}</td>
                     <td>{gap}</td>
                 </tr>
-            """
+            """)
 
-    html += """
+    parts.append("""
             </table>
 
             <h2>Advancement Probabilities</h2>
@@ -780,20 +856,20 @@ def generate_html_report(
                     <th>Outcome</th>
                     <th>Probability</th>
                 </tr>
-    """
+    """)
 
     for outcome in ['medal', 'final', 'semi', 'heat']:
         prob = probabilities.get(outcome, 0)
         prob_str = f"{prob:.0f}%" if isinstance(prob, (int, float)) else str(prob)
-        html += f"""
+        parts.append(f"""
                 <tr>
                     <td>{outcome.capitalize()}</td>
                     <td>{prob_str}</td>
                 </tr>
-        """
+        """)
 
     if competitors:
-        html += """
+        parts.append("""
             </table>
 
             <h2>Top Competitors</h2>
@@ -804,7 +880,7 @@ def generate_html_report(
                     <th>SB</th>
                     <th>Gap</th>
                 </tr>
-        """
+        """)
         for comp in competitors[:5]:
             comp_sb = comp.get('season_best', '-')
             gap = '-'
@@ -814,16 +890,16 @@ def generate_html_report(
                     gap = f"{gap_val:+.2f}"
                 except:
                     pass
-            html += f"""
+            parts.append(f"""
                 <tr>
                     <td>{comp.get('name', '-')}</td>
                     <td>{comp.get('country', '-')}</td>
                     <td>{comp_sb}</td>
                     <td>{gap}</td>
                 </tr>
-            """
+            """)
 
-    html += f"""
+    parts.append(f"""
             </table>
 
             <div class="methodology">
@@ -839,9 +915,9 @@ def generate_html_report(
         </div>
     </body>
     </html>
-    """
+    """)
 
-    return html
+    return parts
 
 
 # Module test